@@ -105,6 +105,16 @@ def _disable_decorator(msg):
     return decorator
 
 
+def _update_ticklabels(axis, kw):
+    """Update the major tick labels. New ticks copy their properties from the
+    first tick, so we do not have to instantiate every tick."""
+    if not kw:
+        return
+    for tick in axis.majorTicks:
+        tick.label1.update(kw)
+        tick.label2.update(kw)
+
+
 def _parse_format(mode=2, rc_kw=None, **kwargs):
     """Separate `~proplot.rctools.rc` setting name value pairs from
     `~Axes.format` keyword arguments."""
@@ -170,22 +180,15 @@ class Axes(maxes.Axes):
         self._altx_parent = None
         self._auto_colorbar = {}  # stores handles and kwargs for auto colorbar
         self._auto_legend = {}
-        coltransform = mtransforms.blended_transform_factory(
-            self.transAxes, self.figure.transFigure)
-        rowtransform = mtransforms.blended_transform_factory(
-            self.figure.transFigure, self.transAxes)
-        self._llabel = self.text(
-            0.05, 0.5, '', va='center', ha='right', transform=rowtransform)
-        self._rlabel = self.text(
-            0.95, 0.5, '', va='center', ha='left', transform=rowtransform)
-        self._blabel = self.text(
-            0.5, 0.05, '', va='top', ha='center', transform=coltransform)
-        self._tlabel = self.text(
-            0.5, 0.95, '', va='bottom', ha='center', transform=coltransform)
-        self._share_setup()
+        self._llabel = None  # row and column labels, see _get_suplabel
+        self._rlabel = None
+        self._blabel = None
+        self._tlabel = None
+        self._suplabel_kw = {}  # settings for labels not yet created
         self.number = number  # for abc numbering
         if main:
             self.figure._axes_main.append(self)
+            self.figure._share_stale = True  # see Figure._share_setup
         self.format(mode=1)  # mode == 1 applies the rcShortParams
 
     def _draw_auto_legends_colorbars(self):
@@ -217,23 +220,30 @@ class Axes(maxes.Axes):
         else:
             return axs
 
-    def _get_extent_axes(self, x):
-        """Return the axes whose horizontal or vertical extent in the main
-        gridspec matches the horizontal or vertical extend of this axes.
-        The lefmost or bottommost axes are at the start of the list."""
-        if not hasattr(self, 'get_subplotspec'):
-            return [self]
-        y = ('y' if x == 'x' else 'x')
-        idx = (0 if x == 'x' else 1)
-        argfunc = (np.argmax if x == 'x' else np.argmin)
-        irange = self._range_gridspec(x)
-        axs = [ax for ax in self.figure._axes_main
-               if ax._range_gridspec(x) == irange]
-        if not axs:
-            return [self]
+    def _get_suplabel(self, side):
+        """Return the row or column label on the left, right, bottom, or top
+        side, creating it on first use. Settings assigned before the label
+        was created are applied here."""
+        s = side[0]
+        obj = getattr(self, '_' + s + 'label')
+        if obj is not None:
+            return obj
+        if s in 'lr':
+            transform = mtransforms.blended_transform_factory(
+                self.figure.transFigure, self.transAxes)
         else:
-            pax = axs.pop(argfunc([ax._range_gridspec(y)[idx] for ax in axs]))
-            return [pax, *axs]
+            transform = mtransforms.blended_transform_factory(
+                self.transAxes, self.figure.transFigure)
+        x, y, ha, va = {
+            'l': (0.05, 0.5, 'right', 'center'),
+            'r': (0.95, 0.5, 'left', 'center'),
+            'b': (0.5, 0.05, 'center', 'top'),
+            't': (0.5, 0.95, 'center', 'bottom'),
+        }[s]
+        obj = self.text(x, y, '', va=va, ha=ha, transform=transform)
+        obj.update(self._suplabel_kw.pop(s, {}))
+        setattr(self, '_' + s + 'label', obj)
+        return obj
 
     def _get_title_props(self, abc=False, loc=None):
         """Return the standardized location name, position keyword arguments,
@@ -396,9 +406,11 @@ class Axes(maxes.Axes):
         pax = paxs[idx]
         kw = {}
         obj = getattr(ax, '_' + s + 'label')
+        if obj is None:  # label was never assigned
+            return pax
         for key in ('color', 'fontproperties'):  # TODO: add to this?
             kw[key] = getattr(obj, 'get_' + key)()
-        pobj = getattr(pax, '_' + s + 'label')
+        pobj = pax._get_suplabel(s)
         pobj.update(kw)
         text = obj.get_text()
         if text:
@@ -486,10 +498,8 @@ class Axes(maxes.Axes):
         self._share_long_axis(sharey, 'l', level)
         self._share_long_axis(sharey, 'r', level)
 
-    def _share_setup(self):
-        """Automatically configure axis sharing based on the horizontal and
-        vertical extent of subplots in the figure gridspec."""
-        # Panel axes sharing, between main subplot and its panels
+    def _share_panels_setup(self):
+        """Configure axis sharing between a main subplot and its panels."""
         def shared(paxs):
             return [
                 pax for pax in paxs
@@ -519,17 +529,6 @@ class Axes(maxes.Axes):
             for iax in paxs:
                 iax._sharey_setup(left, 3)
 
-        # Main axes, sometimes overrides panel axes sharing
-        # TODO: This can get very repetitive, but probably minimal impact?
-        # Share x axes
-        parent, *children = self._get_extent_axes('x')
-        for child in children:
-            child._sharex_setup(parent)
-        # Share y axes
-        parent, *children = self._get_extent_axes('y')
-        for child in children:
-            child._sharey_setup(parent)
-
     def _share_short_axis(self, share, side, level):
         """Share the "short" axes of panels along a main subplot with panels
         along an external subplot."""
@@ -724,7 +723,10 @@ optional
         suptitle = _notNone(
             figtitle, suptitle, None, names=('figtitle', 'suptitle')
         )
-        if len(fig._axes_main) > 1 and rc._context and rc._context[-1][0] == 1:
+        if (
+            len(fig._axes_main) > 1 and rc._context
+            and rc._context[-1].mode == 1
+        ):
             kw = {}
         else:
             kw = rc.fill({
@@ -761,7 +763,11 @@ optional
                 'color': side + 'label.color',
                 'fontfamily': 'font.family'
             }, context=True)
-            if labels or kw:
+            if labels is None and kw and fig._is_bulk_adding:
+                # Each new axes saves the defaults for its own labels, so
+                # there is no need to search for the axes on the edge
+                self._suplabel_kw.setdefault(side[0], {}).update(kw)
+            elif labels or kw:
                 fig._update_labels(self, side, labels, **kw)
 
         # A-b-c labels
@@ -1906,10 +1912,17 @@ class XYAxes(Axes):
                 level = getattr(self.figure, '_share' + x)
                 if level > 0:
                     axis.label.set_visible(False)
-                if level > 2:
+                if level > 2 and not isinstance(
+                    axis.get_major_formatter(), mticker.NullFormatter
+                ):
                     axis.set_major_formatter(mticker.NullFormatter())
             # Enforce no minor ticks labels. TODO: Document?
-            axis.set_minor_formatter(mticker.NullFormatter())
+            # NOTE: Formatters are only replaced if necessary so that the
+            # figure layout fingerprint is unchanged by the draw.
+            if not isinstance(
+                axis.get_minor_formatter(), mticker.NullFormatter
+            ):
+                axis.set_minor_formatter(mticker.NullFormatter())
 
     def _make_twin_axes(self, *args, **kwargs):
         """Return a twin of this axes. This is used for twinx and twiny and was
@@ -2145,6 +2158,8 @@ class XYAxes(Axes):
         :py:obj:`Axes.format`, :py:obj:`Axes.context`
         """
         rc_kw, rc_mode, kwargs = _parse_format(**kwargs)
+        if rc_mode != 1:  # resolve axis sharing before applying settings
+            self.figure._share_setup()
         with rc.context(rc_kw, mode=rc_mode):
             # Background basics
             self.patch.set_clip_on(False)
@@ -2507,8 +2522,7 @@ class XYAxes(Axes):
                         self._datex_rotated = True
                         if rotation not in (0, 90, -90):
                             kw['ha'] = ('right' if rotation > 0 else 'left')
-                for t in axis.get_ticklabels():
-                    t.update(kw)
+                _update_ticklabels(axis, kw)
                 # Margins
                 if margin is not None:
                     self.margins(**{x: margin})
@@ -2934,8 +2948,7 @@ optional
                     'fontfamily': 'font.family',
                     'weight': 'tick.labelweight'
                 }, context=True)
-                for t in axis.get_ticklabels():
-                    t.update(kw)
+                _update_ticklabels(axis, kw)
 
                 # Tick locator, which in this case applies to gridlines
                 # NOTE: Must convert theta locator input to radians, then back
@@ -26,11 +26,17 @@ New conversion tools:
 * `rgb_to_hsluv`
 * `hpluv_to_rgb`
 * `rgb_to_hpluv`
+
+Each of these also has a vectorized ``_array`` version (e.g.
+`hcl_to_rgb_array`) that converts arrays of colors all at once. The
+channel values are stored along the last dimension.
 """
 # Imports (below functions are just meant to be used by user)
 # See: https://stackoverflow.com/a/2353265/4970632
 # The HLS is actually HCL
 import math
+import functools
+import numpy as np
 from colorsys import hls_to_rgb, rgb_to_hls
 # Coefficients or something
 m = [
@@ -340,3 +346,289 @@ def CIEluv_to_CIExyz(triple):
     X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
     Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
     return [X, Y, Z]
+
+
+# Vectorized versions of the above conversions. These accept arrays whose last
+# dimension holds the channel values and apply each step to the whole array.
+def _vectorized(func):
+    # Branches are evaluated for every element, so ignore invalid values in
+    # the branches that are discarded by np.where
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _split(array):
+    array = np.asarray(array, dtype=float)
+    if array.shape[-1:] != (3,):
+        raise ValueError(
+            f'Invalid color array with shape {array.shape}. '
+            'Last dimension must have length 3.'
+        )
+    return array[..., 0], array[..., 1], array[..., 2]
+
+
+def _stack(*channels):
+    return np.stack(np.broadcast_arrays(*channels), axis=-1)
+
+
+@_vectorized
+def hsluv_to_rgb_array(array):
+    return lchuv_to_rgb_array(hsluv_to_lchuv_array(array))
+
+
+@_vectorized
+def rgb_to_hsluv_array(array):
+    return lchuv_to_hsluv_array(rgb_to_lchuv_array(array))
+
+
+@_vectorized
+def hpluv_to_rgb_array(array):
+    return lchuv_to_rgb_array(hpluv_to_lchuv_array(array))
+
+
+@_vectorized
+def rgb_to_hpluv_array(array):
+    return lchuv_to_hpluv_array(rgb_to_lchuv_array(array))
+
+
+@_vectorized
+def lchuv_to_rgb_array(array):
+    return CIExyz_to_rgb_array(
+        CIEluv_to_CIExyz_array(lchuv_to_CIEluv_array(array))
+    )
+
+
+@_vectorized
+def rgb_to_lchuv_array(array):
+    return CIEluv_to_lchuv_array(
+        CIExyz_to_CIEluv_array(rgb_to_CIExyz_array(array))
+    )
+
+
+@_vectorized
+def hsl_to_rgb_array(array):
+    h, s, l = _split(array)  # noqa
+    h, s, l = h / 360.0, s / 100.0, l / 100.0  # noqa
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+
+    def _v(hue):  # see colorsys.hls_to_rgb
+        hue = hue % 1.0
+        return np.select(
+            (hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0),
+            (
+                m1 + (m2 - m1) * hue * 6.0,
+                m2,
+                m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0,
+            ),
+            m1,
+        )
+    gray = (s == 0.0)
+    r = np.where(gray, l, _v(h + 1.0 / 3.0))
+    g = np.where(gray, l, _v(h))
+    b = np.where(gray, l, _v(h - 1.0 / 3.0))
+    return _stack(r, g, b)
+
+
+@_vectorized
+def rgb_to_hsl_array(array):
+    r, g, b = _split(array)
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0  # noqa
+    gray = (minc == maxc)
+    s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    rc = np.where(gray, 0.0, (maxc - r) / rangec)
+    gc = np.where(gray, 0.0, (maxc - g) / rangec)
+    bc = np.where(gray, 0.0, (maxc - b) / rangec)
+    h = np.select(
+        (r == maxc, g == maxc), (bc - gc, 2.0 + rc - bc), 4.0 + gc - rc
+    )
+    h = (h / 6.0) % 1.0
+    h = np.where(gray, 0.0, h)
+    s = np.where(gray, 0.0, s)
+    return _stack(h * 360.0, s * 100.0, l * 100.0)
+
+
+@_vectorized
+def hcl_to_rgb_array(array):
+    h, c, l = _split(array)  # noqa
+    return lchuv_to_rgb_array(_stack(l, c, h))
+
+
+@_vectorized
+def rgb_to_hcl_array(array):
+    l, c, h = _split(rgb_to_lchuv_array(array))  # noqa
+    return _stack(h, c, l)
+
+
+@_vectorized
+def max_chroma_array(L, H):
+    hrad = np.radians(H)
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = np.power(L + 16, 3.0) / 1560896.0
+    sub2 = np.where(sub1 > 0.008856, sub1, L / 903.3)
+    result = np.full(np.shape(L), np.inf)
+    for m1, m2, m3 in m:
+        top = ((0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2)
+        rbottom = (0.86330 * m3 - 0.17266 * m2)
+        lbottom = (0.12949 * m3 - 0.38848 * m1)
+        bottom = (rbottom * sinH + lbottom * cosH) * sub2
+        for t in (0.0, 1.0):
+            C = (L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t))
+            result = np.where((C > 0.0) & (C < result), C, result)
+    return result
+
+
+@_vectorized
+def hrad_extremum_array(L):
+    lhs = (np.power(L, 3.0) + 48.0 * np.power(L, 2.0)
+           + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = np.where(lhs > rhs, lhs, 10.0 * L / 9033.0)
+    chroma = np.full(np.shape(L), np.inf)
+    result = np.full(np.shape(L), np.nan)
+    for row in m:
+        for limit in (0.0, 1.0):
+            [m1, m2, m3] = row
+            top = -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub \
+                - 603093295.0 * limit
+            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
+            hrad = np.arctan2(top, bottom)
+            if limit == 0.0:
+                hrad += math.pi
+            test = max_chroma_array(L, np.degrees(hrad))
+            better = (test < chroma)
+            chroma = np.where(better, test, chroma)
+            result = np.where(better, hrad, result)
+    return result
+
+
+@_vectorized
+def max_chroma_pastel_array(L):
+    H = np.degrees(hrad_extremum_array(L))
+    return max_chroma_array(L, H)
+
+
+@_vectorized
+def hsluv_to_lchuv_array(array):
+    H, S, L = _split(array)
+    C = max_chroma_array(L, H) * S / 100.0
+    C = np.where((L > 99.9999999) | (L < 0.00000001), 0.0, C)
+    L = np.where(L > 99.9999999, 100.0, np.where(L < 0.00000001, 0.0, L))
+    return _stack(L, C, H)
+
+
+@_vectorized
+def lchuv_to_hsluv_array(array):
+    L, C, H = _split(array)
+    S = np.where(C == 0, 0.0, 100.0 * C / max_chroma_array(L, H))
+    S = np.where((L > 99.9999999) | (L < 0.00000001), 0.0, S)
+    L = np.where(L > 99.9999999, 100.0, np.where(L < 0.00000001, 0.0, L))
+    return _stack(H, S, L)
+
+
+@_vectorized
+def hpluv_to_lchuv_array(array):
+    H, S, L = _split(array)
+    C = max_chroma_pastel_array(L) * S / 100.0
+    C = np.where((L > 99.9999999) | (L < 0.00000001), 0.0, C)
+    L = np.where(L > 99.9999999, 100.0, np.where(L < 0.00000001, 0.0, L))
+    return _stack(L, C, H)
+
+
+@_vectorized
+def lchuv_to_hpluv_array(array):
+    L, C, H = _split(array)
+    S = np.where(C == 0, 0.0, 100.0 * C / max_chroma_pastel_array(L))
+    S = np.where((L > 99.9999999) | (L < 0.00000001), 0.0, S)
+    L = np.where(L > 99.9999999, 100.0, np.where(L < 0.00000001, 0.0, L))
+    return _stack(H, S, L)
+
+
+@_vectorized
+def from_linear_array(c):
+    return np.where(
+        c <= 0.0031308, 12.92 * c, 1.055 * np.power(c, 1.0 / 2.4) - 0.055
+    )
+
+
+@_vectorized
+def to_linear_array(c):
+    a = 0.055
+    return np.where(
+        c > 0.04045, np.power((c + a) / (1.0 + a), 2.4), c / 12.92
+    )
+
+
+@_vectorized
+def CIExyz_to_rgb_array(array):
+    return from_linear_array(np.asarray(array, dtype=float) @ np.array(m).T)
+
+
+@_vectorized
+def rgb_to_CIExyz_array(array):
+    rgbl = to_linear_array(np.asarray(array, dtype=float))
+    return rgbl @ np.array(m_inv).T
+
+
+@_vectorized
+def CIEluv_to_lchuv_array(array):
+    L, U, V = _split(array)
+    C = np.sqrt(U ** 2 + V ** 2)
+    H = np.degrees(np.arctan2(V, U))
+    H = np.where(H < 0.0, 360.0 + H, H)
+    return _stack(L, C, H)
+
+
+@_vectorized
+def lchuv_to_CIEluv_array(array):
+    L, C, H = _split(array)
+    Hrad = np.radians(H)
+    return _stack(L, np.cos(Hrad) * C, np.sin(Hrad) * C)
+
+
+@_vectorized
+def CIEfunc_array(t):
+    return np.where(
+        t > lab_e, np.power(t, 1.0 / gamma), 7.787 * t + 16.0 / 116.0
+    )
+
+
+@_vectorized
+def CIEfunc_inverse_array(t):
+    return np.where(
+        np.power(t, 3.0) > lab_e, np.power(t, gamma),
+        (116.0 * t - 16.0) / lab_k
+    )
+
+
+@_vectorized
+def CIExyz_to_CIEluv_array(array):
+    X, Y, Z = _split(array)
+    varU = (4.0 * X) / (X + (15.0 * Y) + (3.0 * Z))
+    varV = (9.0 * Y) / (X + (15.0 * Y) + (3.0 * Z))
+    L = 116.0 * CIEfunc_array(Y / refY) - 16.0
+    U = 13.0 * L * (varU - refU)
+    V = 13.0 * L * (varV - refV)
+    # Black will create a divide-by-zero error
+    black = ((X == 0.0) & (Y == 0.0) & (Z == 0.0)) | (L == 0.0)
+    return np.where(black[..., None], 0.0, _stack(L, U, V))
+
+
+@_vectorized
+def CIEluv_to_CIExyz_array(array):
+    L, U, V = _split(array)
+    varY = CIEfunc_inverse_array((L + 16.0) / 116.0)
+    varU = U / (13.0 * L) + refU
+    varV = V / (13.0 * L) + refV
+    Y = varY * refY
+    X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+    Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+    return np.where((L == 0)[..., None], 0.0, _stack(X, Y, Z))
@@ -8,16 +8,37 @@ See :ref:`Configuring proplot` for details.
 # https://github.com/mwaskom/seaborn/blob/master/seaborn/rcmod.py
 import re
 import os
+import functools
+import threading
 import numpy as np
 import cycler
 import matplotlib.colors as mcolors
 import matplotlib.cm as mcm
 from numbers import Number
+from collections import ChainMap
+from types import MappingProxyType
 from matplotlib import style, rcParams
+from matplotlib.style.core import STYLE_BLACKLIST
 try:  # use this for debugging instead of print()!
     from icecream import ic
 except ImportError:  # graceful fallback if IceCream isn't installed
     ic = lambda *a: None if not a else (a[0] if len(a) == 1 else a)  # noqa
+try:  # python >= 3.7
+    from contextvars import ContextVar
+except ImportError:  # fall back to thread-local settings on python 3.6
+    class ContextVar(object):
+        """Minimal `contextvars.ContextVar` replacement. Values are local to
+        each thread but shared between asyncio tasks in the same thread."""
+        def __init__(self, name, *, default):
+            self.name = name
+            self._default = default
+            self._local = threading.local()
+
+        def get(self):
+            return getattr(self._local, 'value', self._default)
+
+        def set(self, value):
+            self._local.value = value
 try:
     from IPython import get_ipython
 except ImportError:
@@ -143,6 +164,7 @@ defaultParamsLong = {
     'rivers.linewidth': 0.6,
     'subplots.axpad': '1em',
     'subplots.axwidth': '18em',
+    'subplots.maxfigs': 0,
     'subplots.pad': '0.5em',
     'subplots.panelpad': '0.5em',
     'subplots.panelwidth': '4em',
@@ -389,6 +411,71 @@ _rc_categories = {
     )
 }
 
+# Dictionaries searched after the context block caches for each context mode
+_rc_mode_dicts = {
+    0: (rcParamsShort, rcParamsLong, rcParams),
+    1: (rcParamsShort, rcParamsLong),  # custom only!
+    2: (),
+}
+
+# The context blocks entered by the current thread or asyncio task, and the
+# merged view of their settings and context mode. Using context variables
+# means concurrent threads and tasks each see their own context blocks.
+# NOTE: On python 3.6 the blocks are only local to each thread.
+_rc_context = ContextVar('rc_context', default=())
+_rc_context_view = ContextVar('rc_context_view', default=({}, 0))
+
+# Lock used when modifying the global settings dictionaries
+_rc_lock = threading.RLock()
+
+
+class _RcParams(type(rcParams)):
+    """`~matplotlib.RcParams` subclass that returns the settings requested by
+    the `rc_configurator.context` blocks entered by the current thread or
+    asyncio task. The global `rcParams` is converted to this class, so that
+    matplotlib reads the same settings as `rc`."""
+    # NOTE: Only the global instance uses the block settings. Copies are
+    # snapshots of the global settings, since matplotlib.rc_context restores
+    # its copy with a raw update when it exits.
+    def __getitem__(self, key):
+        if self is rcParams:
+            view = _rc_context_view.get()[0]
+            if key in view:
+                return view[key]
+        return super().__getitem__(key)
+
+    def _get(self, key):  # used by matplotlib >= 3.7 for raw lookups
+        if self is rcParams:
+            view = _rc_context_view.get()[0]
+            if key in view:
+                return view[key]
+        return super()._get(key)
+
+    def copy(self):
+        view = _rc_context_view.get()
+        _rc_context_view.set(({}, 0))
+        try:
+            return super().copy()
+        finally:
+            _rc_context_view.set(view)
+
+
+rcParams.__class__ = _RcParams
+
+# Named styles registered with rc.register_style(), resolved into frozen
+# rcParamsShort, rcParamsLong, and rcParams dictionaries
+_rc_styles = {}
+
+# Resolved settings from previous rc_configurator initializations, keyed by
+# the .proplotrc paths and their modification times
+_rc_init_cache = {}
+
+# Index of category names to the settings directly inside them, used by
+# rc.category() to avoid scanning every setting. This is filled lazily and
+# extended by _get_category_keys() whenever new settings are added.
+_rc_category_keys = {}
+_rc_category_seen = set()
+
 
 def _get_config_paths():
     """Return a list of configuration file paths in reverse order of
@@ -412,135 +499,245 @@ def _get_config_paths():
     return paths
 
 
-def _get_synced_params(key, value):
-    """Return dictionaries for updating the `rcParamsShort`, `rcParamsLong`,
-    and `rcParams` properties associated with this key."""
-    kw = {}  # builtin properties that global setting applies to
-    kw_long = {}  # custom properties that global setting applies to
-    kw_short = {}  # short name properties
-
-    # Skip full name keys
-    key = _sanitize_key(key)
-    if '.' in key:
-        pass
+def _get_category_keys(cat):
+    """Return the `rcParamsLong` and `rcParams` settings directly inside the
+    category, first indexing any settings added since the last call."""
+    if len(rcParamsLong) + len(rcParams) > len(_rc_category_seen):
+        for rcdict in (rcParamsLong, rcParams):
+            for key in rcdict:
+                if key in _rc_category_seen:
+                    continue
+                _rc_category_seen.add(key)
+                parent = key.rpartition('.')[0]
+                _rc_category_keys.setdefault(parent, []).append(key)
+                _rc_categories.add(parent)
+                _rc_categories.add(key.partition('.')[0])
+    return _rc_category_keys.get(cat, ())
+
+
+def _get_cycle_colors(cycle):
+    """Return the colors for the color cycle name."""
+    try:
+        return mcm.cmap_d[cycle].colors
+    except (KeyError, AttributeError):
+        cycles = sorted(
+            name for name, cmap in mcm.cmap_d.items()
+            if isinstance(cmap, mcolors.ListedColormap)
+        )
+        raise ValueError(
+            f'Invalid cycle name {cycle!r}. Options are: '
+            ', '.join(map(repr, cycles)) + '.'
+        )
 
-    # Backend
-    elif key == 'inlinefmt':
-        inline_backend_fmt(value)
 
-    # Cycler
-    elif key in ('cycle', 'rgbcycle'):
-        if key == 'rgbcycle':
-            cycle, rgbcycle = rcParamsShort['cycle'], value
-        else:
-            cycle, rgbcycle = value, rcParamsShort['rgbcycle']
-        try:
-            colors = mcm.cmap_d[cycle].colors
-        except (KeyError, AttributeError):
-            cycles = sorted(
-                name for name, cmap in mcm.cmap_d.items()
-                if isinstance(cmap, mcolors.ListedColormap)
-            )
-            raise ValueError(
-                f'Invalid cycle name {cycle!r}. Options are: '
-                ', '.join(map(repr, cycles)) + '.'
-            )
-        if rgbcycle and cycle.lower() == 'colorblind':
-            regcolors = colors + [(0.1, 0.1, 0.1)]
-        elif mcolors.to_rgb('r') != (1.0, 0.0, 0.0):  # reset
-            regcolors = [
-                (0.0, 0.0, 1.0),
-                (1.0, 0.0, 0.0),
-                (0.0, 1.0, 0.0),
-                (0.75, 0.75, 0.0),
-                (0.75, 0.75, 0.0),
-                (0.0, 0.75, 0.75),
-                (0.0, 0.0, 0.0)
-            ]
-        else:
-            regcolors = []  # no reset necessary
-        for code, color in zip('brgmyck', regcolors):
-            rgb = mcolors.to_rgb(color)
-            mcolors.colorConverter.colors[code] = rgb
-            mcolors.colorConverter.cache[code] = rgb
-        kw['patch.facecolor'] = colors[0]
-        kw['axes.prop_cycle'] = cycler.cycler('color', colors)
-
-    # Zero linewidth almost always means zero tick length
-    elif key == 'linewidth' and _to_points(key, value) == 0:
-        _, ikw_long, ikw = _get_synced_params('ticklen', 0)
-        kw.update(ikw)
-        kw_long.update(ikw_long)
-
-    # Tick length/major-minor tick length ratio
-    elif key in ('ticklen', 'ticklenratio'):
-        if key == 'ticklen':
-            ticklen = _to_points(key, value)
-            ratio = rcParamsShort['ticklenratio']
-        else:
-            ticklen = rcParamsShort['ticklen']
-            ratio = value
-        kw['xtick.minor.size'] = ticklen * ratio
-        kw['ytick.minor.size'] = ticklen * ratio
-
-    # Spine width/major-minor tick width ratio
-    elif key in ('linewidth', 'tickratio'):
-        if key == 'linewidth':
-            tickwidth = _to_points(key, value)
-            ratio = rcParamsShort['tickratio']
+def _sync_cycle(key, value, staged=None):
+    """Update the property cycler."""
+    kw = {}
+    cycle = value if key == 'cycle' else _get_param('cycle', staged)
+    colors = _get_cycle_colors(cycle)
+    kw['patch.facecolor'] = colors[0]
+    kw['axes.prop_cycle'] = cycler.cycler('color', colors)
+    return value, {}, kw
+
+
+def _update_color_codes(cycle, rgbcycle):
+    """Update the single-letter color codes for the color cycle."""
+    colors = _get_cycle_colors(cycle)
+    if rgbcycle and cycle.lower() == 'colorblind':
+        regcolors = colors + [(0.1, 0.1, 0.1)]
+    elif mcolors.to_rgb('r') != (1.0, 0.0, 0.0):  # reset
+        regcolors = [
+            (0.0, 0.0, 1.0),
+            (1.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (0.75, 0.75, 0.0),
+            (0.75, 0.75, 0.0),
+            (0.0, 0.75, 0.75),
+            (0.0, 0.0, 0.0)
+        ]
+    else:
+        regcolors = []  # no reset necessary
+    for code, color in zip('brgmyck', regcolors):
+        rgb = mcolors.to_rgb(color)
+        mcolors.colorConverter.colors[code] = rgb
+        mcolors.colorConverter.cache[code] = rgb
+
+
+def _apply_side_effects(rc_short):
+    """Apply the side effects of changing the `rcParamsShort` settings in the
+    input dictionary. This must be called after the settings are applied."""
+    # NOTE: The inline backend format and the color codes are global, so
+    # these use the settings of the thread that changed them last.
+    if 'inlinefmt' in rc_short:
+        inline_backend_fmt(_get_param('inlinefmt'))
+    if 'cycle' in rc_short or 'rgbcycle' in rc_short:
+        _update_color_codes(_get_param('cycle'), _get_param('rgbcycle'))
+
+
+def _update_params(rc_short, rc_long, rc):
+    """Apply the dictionaries returned by `_get_synced_params` or
+    `_get_synced_batch` to the global settings."""
+    rcParamsShort.update(rc_short)
+    rcParamsLong.update(rc_long)
+    rcParams.update(rc)
+    _apply_side_effects(rc_short)
+
+
+def _sync_ticklen(key, value, staged=None):
+    """Update the minor tick lengths."""
+    kw = {}
+    if key == 'ticklen':
+        ticklen = _to_points(key, value)
+        ratio = _get_param('ticklenratio', staged)
+    else:
+        ticklen = _get_param('ticklen', staged)
+        ratio = value
+    kw['xtick.minor.size'] = ticklen * ratio
+    kw['ytick.minor.size'] = ticklen * ratio
+    return value, {}, kw
+
+
+def _sync_tickwidth(key, value, staged=None):
+    """Update the minor tick widths. Zero linewidth almost always means zero
+    tick length, so in that case the tick lengths are updated instead."""
+    kw = {}
+    if key == 'linewidth':
+        tickwidth = _to_points(key, value)
+        if tickwidth == 0:
+            _, kw_long, kw = _get_synced_params('ticklen', 0, staged)
+            return value, kw_long, kw
+        ratio = _get_param('tickratio', staged)
+    else:
+        tickwidth = _get_param('linewidth', staged)
+        ratio = value
+    kw['xtick.minor.width'] = tickwidth * ratio
+    kw['ytick.minor.width'] = tickwidth * ratio
+    return value, {}, kw
+
+
+def _sync_gridwidth(key, value, staged=None):
+    """Update the minor gridline width."""
+    kw_long = {}
+    gridwidth = _get_param('grid.linewidth', staged)
+    kw_long['gridminor.linewidth'] = gridwidth * value
+    return value, kw_long, {}
+
+
+def _sync_grid(key, value, staged=None):
+    """Toggle the major and minor gridlines. This is complicated because of the
+    clunky way this is implemented in matplotlib. There should be a gridminor
+    setting!"""
+    kw = {}
+    ovalue = _get_param('axes.grid', staged)
+    owhich = _get_param('axes.grid.which', staged)
+    # Instruction is to turn off gridlines
+    if not value:
+        # Gridlines are already off, or they are on for the particular
+        # ones that we want to turn off. Instruct to turn both off.
+        if not ovalue or (key == 'grid' and owhich == 'major') or (
+                key == 'gridminor' and owhich == 'minor'):
+            which = 'both'  # disable both sides
+        # Gridlines are currently on for major and minor ticks, so we
+        # instruct to turn on gridlines for the one we *don't* want off
+        elif owhich == 'both':  # and ovalue is True, as we already tested
+            # if gridminor=False, enable major, and vice versa
+            value = True
+            which = 'major' if key == 'gridminor' else 'minor'
+        # Gridlines are on for the ones that we *didn't* instruct to turn
+        # off, and off for the ones we do want to turn off. This just
+        # re-asserts the ones that are already on.
         else:
-            tickwidth = rcParamsShort['linewidth']
-            ratio = value
-        kw['xtick.minor.width'] = tickwidth * ratio
-        kw['ytick.minor.width'] = tickwidth * ratio
-
-    # Gridline width
-    elif key in ('grid.linewidth', 'gridratio'):
-        if key == 'grid.linewidth':
-            gridwidth = _to_points(key, value)
-            ratio = rcParamsShort['gridratio']
+            value = True
+            which = owhich
+    # Instruction is to turn on gridlines
+    else:
+        # Gridlines are already both on, or they are off only for the ones
+        # that we want to turn on. Turn on gridlines for both.
+        if owhich == 'both' or (key == 'grid' and owhich == 'minor') or (
+                key == 'gridminor' and owhich == 'major'):
+            which = 'both'
+        # Gridlines are off for both, or off for the ones that we
+        # don't want to turn on. We can just turn on these ones.
         else:
-            gridwidth = rcParams['grid.linewidth']
-            ratio = value
-        kw_long['gridminor.linewidth'] = gridwidth * ratio
-
-    # Gridline toggling, complicated because of the clunky way this is
-    # implemented in matplotlib. There should be a gridminor setting!
-    elif key in ('grid', 'gridminor'):
-        ovalue = rcParams['axes.grid']
-        owhich = rcParams['axes.grid.which']
-        # Instruction is to turn off gridlines
-        if not value:
-            # Gridlines are already off, or they are on for the particular
-            # ones that we want to turn off. Instruct to turn both off.
-            if not ovalue or (key == 'grid' and owhich == 'major') or (
-                    key == 'gridminor' and owhich == 'minor'):
-                which = 'both'  # disable both sides
-            # Gridlines are currently on for major and minor ticks, so we
-            # instruct to turn on gridlines for the one we *don't* want off
-            elif owhich == 'both':  # and ovalue is True, as we already tested
-                # if gridminor=False, enable major, and vice versa
-                value = True
-                which = 'major' if key == 'gridminor' else 'minor'
-            # Gridlines are on for the ones that we *didn't* instruct to turn
-            # off, and off for the ones we do want to turn off. This just
-            # re-asserts the ones that are already on.
-            else:
-                value = True
-                which = owhich
-        # Instruction is to turn on gridlines
+            which = owhich
+    kw['axes.grid'] = value
+    kw['axes.grid.which'] = which
+    return value, {}, kw
+
+
+# Settings that require special treatment, the functions that return their
+# value and synced rcParamsLong and rcParams updates, and the settings the
+# synced values depend on. The remaining settings are simply copied to their
+# _rc_children. Expansions are memoized on the key, the value, and the
+# current values of the dependencies, except for settings in _rc_volatile.
+_rc_synced = {
+    'cycle': (_sync_cycle, ()),
+    'ticklen': (_sync_ticklen, ('ticklenratio',)),
+    'ticklenratio': (_sync_ticklen, ('ticklen',)),
+    'linewidth': (_sync_tickwidth, ('tickratio', 'ticklenratio')),
+    'tickratio': (_sync_tickwidth, ('linewidth',)),
+    'gridratio': (_sync_gridwidth, ('grid.linewidth',)),
+    'grid': (_sync_grid, ('axes.grid', 'axes.grid.which')),
+    'gridminor': (_sync_grid, ('axes.grid', 'axes.grid.which')),
+}
+
+# Settings that depend on the registered colormaps
+_rc_volatile = ('cycle',)
+
+# Settings that units() uses to interpret relative size strings
+_rc_units_dependencies = (
+    'font.size', 'axes.titlesize', 'figure.dpi', 'savefig.dpi'
+)
+
+# Memoized _get_synced_params output
+_rc_synced_cache = {}
+_rc_synced_cache_size = 1000
+
+
+def _get_param(key, staged=None):
+    """Return the setting, preferring the values staged by a batch update
+    and then the context block settings for the current thread or task."""
+    if staged and key in staged:
+        return staged[key]
+    view = _rc_context_view.get()[0]
+    if key in view:
+        return view[key]
+    for rcdict in (rcParamsShort, rcParamsLong):
+        if key in rcdict:
+            return rcdict[key]
+    return rcParams[key]
+
+
+def _get_synced_params(key, value, staged=None):
+    """Return dictionaries for updating the `rcParamsShort`, `rcParamsLong`,
+    and `rcParams` properties associated with this key. Setting values in
+    `staged` take precedence over the current settings."""
+    # Get cached expansion. Note string sizes may be relative to font sizes,
+    # and the type is included so that e.g. True and 1 are not conflated.
+    key = _sanitize_key(key)
+    func, deps = _rc_synced.get(key, (None, ()))
+    if isinstance(value, str) and _is_points_key(key):
+        deps = (*deps, *_rc_units_dependencies)
+    cachekey = None
+    if key not in _rc_volatile:
+        cachekey = (key, type(value), value, *(
+            _get_param(dep, staged) for dep in deps
+        ))
+        try:
+            kw_short, kw_long, kw = _rc_synced_cache[cachekey]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable value
+            cachekey = None
         else:
-            # Gridlines are already both on, or they are off only for the ones
-            # that we want to turn on. Turn on gridlines for both.
-            if owhich == 'both' or (key == 'grid' and owhich == 'minor') or (
-                    key == 'gridminor' and owhich == 'major'):
-                which = 'both'
-            # Gridlines are off for both, or off for the ones that we
-            # don't want to turn on. We can just turn on these ones.
-            else:
-                which = owhich
-        kw['axes.grid'] = value
-        kw['axes.grid.which'] = which
+            return kw_short.copy(), kw_long.copy(), kw.copy()
+
+    # Get special updates
+    kw = {}  # builtin properties that global setting applies to
+    kw_long = {}  # custom properties that global setting applies to
+    kw_short = {}  # short name properties
+    if func is not None:
+        value, kw_long, kw = func(key, value, staged)
 
     # Update setting in dictionary, detect invalid keys
     value = _to_points(key, value)
@@ -559,9 +756,110 @@ def _get_synced_params(key, value):
             kw_long[name] = value
         else:
             kw[name] = value
+
+    # Cache the result
+    if cachekey is not None:
+        if len(_rc_synced_cache) >= _rc_synced_cache_size:
+            _rc_synced_cache.clear()
+        _rc_synced_cache[cachekey] = (kw_short, kw_long, kw)
+        kw_short, kw_long, kw = kw_short.copy(), kw_long.copy(), kw.copy()
     return kw_short, kw_long, kw
 
 
+def _get_synced_batch(kwargs, staged=None):
+    """Return dictionaries for updating the `rcParamsShort`, `rcParamsLong`,
+    and `rcParams` properties associated with each key in the dictionary.
+    Settings are expanded as if the previous settings were already applied,
+    and `rcParams` values are validated, so nothing needs to be applied
+    until every setting is known to be valid. Settings in `staged` take
+    precedence over the current settings."""
+    kw_short, kw_long, kw = {}, {}, {}
+    staged = dict(staged or {})
+    for key, value in kwargs.items():
+        ikw_short, ikw_long, ikw = _get_synced_params(key, value, staged)
+        for name, ivalue in ikw.items():
+            if name in rcParams.validate:
+                ikw[name] = rcParams.validate[name](ivalue)
+        for rcdict, ircdict in (
+            (kw_short, ikw_short), (kw_long, ikw_long), (kw, ikw)
+        ):
+            rcdict.update(ircdict)
+            staged.update(ircdict)
+    return kw_short, kw_long, kw
+
+
+def _get_dict(key):
+    """Return the global settings dictionary containing the key."""
+    for rcdict in (rcParamsShort, rcParamsLong):
+        if key in rcdict:
+            return rcdict
+    return rcParams
+
+
+def _is_equal(value1, value2):
+    """Return whether the setting values are equal."""
+    if value1 is value2:
+        return True
+    try:
+        return bool(value1 == value2)
+    except ValueError:  # e.g. arrays or cyclers of arrays
+        pass
+    try:
+        return np.array_equal(value1, value2)
+    except ValueError:
+        return False
+
+
+def _copy_params(rcdict):
+    """Return a copy of the settings dictionary with copies of the list values,
+    since these are often modified in-place (e.g. the font family lists)."""
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in rcdict.items()
+    }
+
+
+def _get_settings():
+    """Return copies of the global settings dictionaries updated with the
+    context block settings for the current thread or task. Used to pass the
+    current settings to worker processes."""
+    view = _rc_context_view.get()[0]
+    params = {
+        key: view.get(key, value) for key, value in dict.items(rcParams)
+        if key not in STYLE_BLACKLIST
+    }
+    return tuple(map(_copy_params, (
+        {key: view.get(key, value) for key, value in rcParamsShort.items()},
+        {key: view.get(key, value) for key, value in rcParamsLong.items()},
+        params,
+    )))
+
+
+def _set_settings(settings):
+    """Replace the global settings dictionaries with the output of
+    `_get_settings`. Settings are not re-validated."""
+    short, long, params = settings
+    dict.update(rcParams, _copy_params(params))
+    rcParamsLong.clear()
+    rcParamsLong.update(_copy_params(long))
+    rcParamsShort.clear()
+    rcParamsShort.update(_copy_params(short))
+    _apply_side_effects(rcParamsShort)
+
+
+def _get_init_key(local=True):
+    """Return the key used to cache the resolved settings, or ``None`` if the
+    configuration files cannot be read."""
+    paths = _get_config_paths() if local else ()
+    try:
+        return tuple(
+            (path, os.stat(path).st_mtime_ns, os.stat(path).st_size)
+            for path in paths
+        )
+    except OSError:
+        return None
+
+
 def _sanitize_key(key):
     """Ensure string and convert keys with omitted dots."""
     if not isinstance(key, str):
@@ -571,81 +869,187 @@ def _sanitize_key(key):
     return key.lower()
 
 
-def _to_points(key, value):
-    """Convert certain rc keys to the units "points"."""
+@functools.lru_cache(maxsize=None)
+def _is_points_key(key):
+    """Return whether the rc key uses the units "points"."""
     # TODO: Incorporate into more sophisticated validation system
     # See: https://matplotlib.org/users/customizing.html, all props matching
     # the below strings use the units 'points', except custom categories!
-    if (
-        isinstance(value, str)
-        and key.split('.')[0] not in ('colorbar', 'subplots')
+    return bool(
+        key.split('.')[0] not in ('colorbar', 'subplots')
         and re.match('^.*(width|space|size|pad|len|small|large)$', key)
-    ):
+    )
+
+
+def _to_points(key, value):
+    """Convert certain rc keys to the units "points"."""
+    if isinstance(value, str) and _is_points_key(key):
         value = units(value, 'pt')
     return value
 
 
-def _update_from_file(file):
+def _parse_bool(value):
+    """Convert a ``.proplotrc`` string to a boolean."""
+    if value not in ('True', 'False'):
+        raise ValueError('Expected True or False.')
+    return value == 'True'
+
+
+def _parse_number(value):
+    """Convert a ``.proplotrc`` string to a number or a size string."""
+    try:
+        # int-float distinction does not matter in python3
+        return float(value)
+    except ValueError:
+        if not re.match(r'\A[-+]?(\d+\.?\d*|\.\d+)[a-zA-Z]+\Z', value):
+            raise ValueError('Expected number or size string with units.')
+        return value
+
+
+def _parse_any(value):
+    """Convert a ``.proplotrc`` string with *very primitive* type inference."""
+    if value in ('True', 'False'):
+        return value == 'True'
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _parse_level(value):
+    """Convert a ``.proplotrc`` string to a boolean or an integer level."""
+    if value in ('True', 'False'):
+        return value == 'True'
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError('Expected True, False, or an integer.')
+
+
+# Settings that accept more than the type of their default value
+_rc_parsers = {
+    'align': _parse_level,
+    'share': _parse_level,
+    'span': _parse_level,
+}
+
+
+# Trailing comments in ``.proplotrc`` files. Hex colors are not comments.
+_rc_comment = re.compile(r'(?:\A|\s)#(?![0-9a-fA-F]{3,8}\b).*')
+
+
+def _get_parser(key):
+    """Return the function used to convert ``.proplotrc`` strings for this
+    setting. This is inferred from the default value unless the setting is
+    in `_rc_parsers`. Builtin `rcParams` are left alone and validated by
+    matplotlib."""
+    if key in _rc_parsers:
+        return _rc_parsers[key]
+    elif key in defaultParamsShort:
+        default = defaultParamsShort[key]
+    elif key in defaultParamsLong:
+        default = defaultParamsLong[key]
+    else:
+        return None
+    if isinstance(default, bool):
+        return _parse_bool
+    elif isinstance(default, Number):
+        return _parse_number
+    else:
+        return _parse_any
+
+
+def _parse_file(file):
     """
-    Apply updates from a file. This is largely copied from matplotlib.
+    Return a dictionary of the settings in a ``.proplotrc`` file. Illegal
+    lines, duplicate keys, and invalid keys are skipped with a warning.
 
     Parameters
     ----------
     file : str
         The path.
+
+    Raises
+    ------
+    ValueError
+        If any of the values are invalid. The message lists every invalid
+        value in the file.
     """
-    cnt = 0
-    file = os.path.expanduser(file)
-    added = set()
+    kw = {}
+    errors = []
     with open(file, 'r') as fd:
-        for line in fd:
-            # Read file
-            cnt += 1
-            stripped = line.split('#', 1)[0].strip()
-            if not stripped:
-                continue
-            pair = stripped.split(':', 1)
-            if len(pair) != 2:
-                _warn_proplot(
-                    f'Illegal line #{cnt} in file {file!r}:\n{line!r}"'
-                )
+        lines = fd.read().splitlines()
+    for cnt, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] == '#':
+            continue
+        key, sep, value = _rc_comment.sub('', stripped).partition(':')
+        if not sep:
+            _warn_proplot(
+                f'Illegal line #{cnt} in file {file!r}:\n{line!r}"'
+            )
+            continue
+        key = key.strip()
+        value = value.strip()
+        try:
+            key = _sanitize_key(key)
+        except KeyError:
+            pass
+        if key not in rcParamsShort and key not in rcParamsLong and (
+                key not in rcParams):
+            _warn_proplot(
+                f'Invalid key {key!r} on line #{cnt} in file {file!r}.'
+            )
+            continue
+        if key in kw:
+            _warn_proplot(
+                f'Duplicate key {key!r} on line #{cnt} in file {file!r}.'
+            )
+            del kw[key]  # apply in order of the last occurrence
+
+        # Convert proplot settings according to the type of the default.
+        # Empty strings and 'None' are always allowed. Builtin settings are
+        # validated by matplotlib so every invalid value is reported at once.
+        # TODO: Add built-in validation by making special RcParamsLong
+        # and RcParamsShort classes just like matplotlib RcParams
+        parser = _get_parser(key)
+        if parser is not None and value in ('', 'None'):
+            value = None  # older proplot versions supported empty values
+        elif parser is not None or key in rcParams.validate:
+            try:
+                if parser is not None:
+                    value = parser(value)
+                else:  # the string is converted when applied
+                    rcParams.validate[key](value)
+            except ValueError as err:
+                errors.append(f'Line #{cnt} {key}: {value!r}. {err}')
                 continue
-            key, value = pair
-            key = key.strip()
-            value = value.strip()
-            if key in added:
-                _warn_proplot(
-                    f'Duplicate key {key!r} on line #{cnt} in file {file!r}.'
-                )
-            added.add(key)
-
-            # *Very primitive* type conversion system. Just check proplot
-            # settings (they are all simple/scalar) and leave rcParams alone.
-            # TODO: Add built-in validation by making special RcParamsLong
-            # and RcParamsShort classes just like matplotlib RcParams
-            if key in rcParamsShort or key in rcParamsLong:
-                if not value:
-                    value = None  # older proplot versions supported this
-                elif value in ('True', 'False', 'None'):
-                    value = eval(value)  # rare case where eval is o.k.
-                else:
-                    try:
-                        # int-float distinction does not matter in python3
-                        value = float(value)
-                    except ValueError:
-                        pass
+        kw[key] = value
+    if errors:
+        raise ValueError(
+            f'Invalid values in file {file!r}:\n' + '\n'.join(errors)
+        )
+    return kw
 
-            # Add to dictionaries
-            try:
-                rc_short, rc_long, rc = _get_synced_params(key, value)
-            except KeyError:
-                _warn_proplot(
-                    f'Invalid key {key!r} on line #{cnt} in file {file!r}.'
-                )
-            else:
-                rcParamsShort.update(rc_short)
-                rcParamsLong.update(rc_long)
-                rcParams.update(rc)
+
+def _update_from_file(file):
+    """
+    Apply updates from a file. The file is parsed and validated in full,
+    and its settings are applied all at once or not at all.
+
+    Parameters
+    ----------
+    file : str
+        The path.
+    """
+    file = os.path.expanduser(file)
+    try:
+        kw = _parse_file(file)
+        rc_short, rc_long, rc = _get_synced_batch(kw)
+    except (KeyError, ValueError) as err:
+        _warn_proplot(f'Settings from file {file!r} were not applied. {err}')
+        return
+    _update_params(rc_short, rc_long, rc)
 
 
 def _write_defaults(filename, comment=True, overwrite=False):
@@ -732,6 +1136,17 @@ def _write_defaults(filename, comment=True, overwrite=False):
 """.strip())
 
 
+class _RcBlock(object):
+    """A context block created by `rc_configurator.context`."""
+    __slots__ = ('mode', 'kwargs', 'style', 'cache')
+
+    def __init__(self, mode, kwargs, style=None):
+        self.mode = mode
+        self.kwargs = kwargs
+        self.style = style  # resolved style settings
+        self.cache = {}  # settings requested by the block
+
+
 class rc_configurator(object):
     """
     Magical abstract class for managing matplotlib
@@ -769,65 +1184,52 @@ class rc_configurator(object):
             file(s). Default is ``True``.
         """
         # Remove context objects
-        object.__setattr__(self, '_context', [])
+        _rc_context.set(())
+        self._rebuild_context()
 
-        # Set default style
-        # NOTE: Previously, style.use would trigger first pyplot import because
-        # rcParams.__getitem__['backend'] imports pyplot.switch_backend() so it
-        # can determine the default backend.
-        style.use('default')
-
-        # Update from defaults
-        rcParams.update(defaultParams)
-        rcParamsLong.clear()
-        rcParamsLong.update(defaultParamsLong)
-        rcParamsShort.clear()
-        rcParamsShort.update(defaultParamsShort)
-        for rcdict in (rcParamsShort, rcParamsLong):
-            for key, value in rcdict.items():
-                _, rc_long, rc = _get_synced_params(key, value)
-                rcParamsLong.update(rc_long)
-                rcParams.update(rc)
-
-        # Update from files
-        if not local:
-            return
-        for i, file in enumerate(_get_config_paths()):
-            if not os.path.exists(file):
-                continue
-            _update_from_file(file)
+        # Update the settings
+        with _rc_lock:
+            self._load_settings(local)
 
     def __enter__(self):
         """Apply settings from the most recent context block."""
-        if not self._context:
+        context = _rc_context.get()
+        if not context:
             raise RuntimeError(
                 f'rc object must be initialized with rc.context().'
             )
-        *_, kwargs, cache, restore = self._context[-1]
-
-        def _update(rcdict, newdict):
-            for key, value in newdict.items():
-                restore[key] = rcdict[key]
-                rcdict[key] = cache[key] = value
-        for key, value in kwargs.items():
-            rc_short, rc_long, rc = _get_synced_params(key, value)
-            _update(rcParamsShort, rc_short)
-            _update(rcParamsLong, rc_long)
-            _update(rcParams, rc)
+        block = context[-1]
+        cache = block.cache
+
+        # Expand and validate the settings using the settings of the enclosing
+        # blocks. Nothing is written to the global dictionaries. Instead the
+        # cache overrides them for the current thread or task, including
+        # when matplotlib reads rcParams (see _RcParams).
+        if block.style is not None:  # already resolved and validated
+            for rcdict in block.style:
+                cache.update(rcdict)
+        with _rc_lock:
+            try:
+                rcdicts = _get_synced_batch(block.kwargs, cache)
+            except Exception:  # invalid settings
+                _rc_context.set(context[:-1])
+                raise
+        for rcdict in rcdicts:
+            cache.update(rcdict)
+        self._rebuild_context()
+        _apply_side_effects(cache)
 
     def __exit__(self, *args):
         """Restore settings from the most recent context block."""
-        if not self._context:
+        context = _rc_context.get()
+        if not context:
             raise RuntimeError(
                 f'rc object must be initialized with rc.context().'
             )
-        *_, restore = self._context[-1]
-        for key, value in restore.items():
-            rc_short, rc_long, rc = _get_synced_params(key, value)
-            rcParamsShort.update(rc_short)
-            rcParamsLong.update(rc_long)
-            rcParams.update(rc)
-        del self._context[-1]
+        block = context[-1]
+        _rc_context.set(context[:-1])
+        self._rebuild_context()
+        _apply_side_effects(block.cache)
 
     def __delitem__(self, *args):
         """Raise an error. This enforces pseudo-immutability."""
@@ -850,7 +1252,8 @@ class rc_configurator(object):
 <https://matplotlib.org/users/customizing.html>`__,
         :ref:`rcParamsLong`, or :ref:`rcParamsShort` setting."""
         key = _sanitize_key(key)
-        for kw in (rcParamsShort, rcParamsLong, rcParams):
+        for kw in (_rc_context_view.get()[0], rcParamsShort, rcParamsLong,
+                   rcParams):
             try:
                 return kw[key]
             except KeyError:
@@ -865,29 +1268,25 @@ class rc_configurator(object):
         """Modify an `rcParams \
 <https://matplotlibcorg/users/customizing.html>`__,
         :ref:`rcParamsLong`, and :ref:`rcParamsShort` setting(s)."""
-        rc_short, rc_long, rc = _get_synced_params(key, value)
-        rcParamsShort.update(rc_short)
-        rcParamsLong.update(rc_long)
-        rcParams.update(rc)
+        with _rc_lock:
+            self._update_params(*_get_synced_params(key, value))
 
     def _get_item(self, key, mode=None):
         """As with `~rc_configurator.__getitem__` but the search is limited
         based on the context mode and ``None`` is returned if the key is not
         found in the dictionaries."""
+        cache, imode = _rc_context_view.get()
         if mode is None:
-            mode = min((context[0] for context in self._context), default=0)
-        caches = (context[2] for context in self._context)
-        if mode == 0:
-            rcdicts = (*caches, rcParamsShort, rcParamsLong, rcParams)
-        elif mode == 1:
-            rcdicts = (*caches, rcParamsShort, rcParamsLong)  # custom only!
-        elif mode == 2:
-            rcdicts = (*caches,)
-        else:
+            mode = imode
+        try:
+            rcdicts = _rc_mode_dicts[mode]
+        except KeyError:
             raise KeyError(f'Invalid caching mode {mode!r}.')
+        try:
+            return cache[key]
+        except KeyError:
+            pass
         for rcdict in rcdicts:
-            if not rcdict:
-                continue
             try:
                 return rcdict[key]
             except KeyError:
@@ -897,6 +1296,94 @@ class rc_configurator(object):
         else:
             return
 
+    def _load_settings(self, local=True):
+        """Reset the global settings dictionaries to the defaults and apply
+        the ``.proplotrc`` overrides."""
+        # Use the cached settings if the defaults and files have not changed
+        # NOTE: Settings were validated when they were first resolved, so we
+        # skip validation just like matplotlib.rc_context.
+        defaults = (defaultParamsShort, defaultParamsLong, defaultParams)
+        cachekey = _get_init_key(local)
+        cached = _rc_init_cache.get(cachekey, None)
+        if cached is not None and cached[0] == defaults:
+            _set_settings(cached[1:])
+            return
+
+        # Set default style
+        # NOTE: Previously, style.use would trigger first pyplot import because
+        # rcParams.__getitem__['backend'] imports pyplot.switch_backend() so it
+        # can determine the default backend.
+        style.use('default')
+
+        # Update from defaults
+        rcParams.update(defaultParams)
+        rcParamsLong.clear()
+        rcParamsLong.update(defaultParamsLong)
+        rcParamsShort.clear()
+        rcParamsShort.update(defaultParamsShort)
+        for rcdict in (rcParamsShort, rcParamsLong):
+            for key, value in rcdict.items():
+                _, rc_long, rc = _get_synced_params(key, value)
+                rcParamsLong.update(rc_long)
+                rcParams.update(rc)
+        _apply_side_effects(rcParamsShort)
+
+        # Update from files
+        if local:
+            for i, file in enumerate(_get_config_paths()):
+                if not os.path.exists(file):
+                    continue
+                _update_from_file(file)
+
+        # Cache the resolved settings
+        if cachekey is not None:
+            _rc_init_cache[cachekey] = (
+                tuple(map(_copy_params, defaults)), *_get_settings(),
+            )
+
+    @property
+    def _context(self):
+        """The context blocks for the current thread or asyncio task."""
+        return list(_rc_context.get())
+
+    def _rebuild_context(self):
+        """Rebuild the merged view of the context block caches and the
+        effective context mode for the current thread or asyncio task. This is
+        called whenever a context block is entered or exited so that
+        `~rc_configurator._get_item` only needs a single lookup for cached
+        settings."""
+        # NOTE: Innermost blocks take precedence, since these settings were
+        # applied last. The view overrides the global settings in __getitem__
+        # and in rcParams lookups, so threads see their own settings.
+        context = _rc_context.get()
+        caches = ChainMap(*(block.cache for block in reversed(context)))
+        mode = min((block.mode for block in context), default=0)
+        _rc_context_view.set((dict(caches), mode))
+
+    def _update_params(self, *rcdicts):
+        """Apply the dictionaries returned by `_get_synced_params` or
+        `_get_synced_batch`. Settings requested by a context block of the
+        current thread or task are changed in the innermost such block, so
+        they are discarded when the block exits. Other settings are applied
+        to the global dictionaries."""
+        context = _rc_context.get()
+        rcdicts_global = tuple({} for _ in rcdicts)
+        changed = {}
+        for rcdict, rcdict_global in zip(rcdicts, rcdicts_global):
+            for key, value in rcdict.items():
+                for block in reversed(context):
+                    if key in block.cache:
+                        if key in rcParams.validate:
+                            value = rcParams.validate[key](value)
+                        block.cache[key] = changed[key] = value
+                        break
+                else:
+                    rcdict_global[key] = value
+        _update_params(*rcdicts_global)
+        if changed:
+            self._rebuild_context()
+            _apply_side_effects(changed)
+
     def category(self, cat, *, trimcat=True, context=False):
         """
         Return a dictionary of settings beginning with the substring
@@ -914,6 +1401,7 @@ class rc_configurator(object):
             context mode dictionaries is omitted from the output dictionary.
             See `~rc_configurator.context`.
         """
+        keys = _get_category_keys(cat)
         if cat not in _rc_categories:
             raise ValueError(
                 f'Invalid rc category {cat!r}. Valid categories are '
@@ -921,19 +1409,15 @@ class rc_configurator(object):
             )
         kw = {}
         mode = 0 if not context else None
-        for rcdict in (rcParamsLong, rcParams):
-            for key in rcdict:
-                if not re.match(fr'\A{cat}\.[^.]+\Z', key):
-                    continue
-                value = self._get_item(key, mode)
-                if value is None:
-                    continue
-                if trimcat:
-                    key = re.sub(fr'\A{cat}\.', '', key)
-                kw[key] = value
+        start = len(cat) + 1 if trimcat else 0
+        for key in keys:
+            value = self._get_item(key, mode)
+            if value is None:
+                continue
+            kw[key[start:]] = value
         return kw
 
-    def context(self, *args, mode=0, **kwargs):
+    def context(self, *args, mode=0, style=None, **kwargs):
         """
         Temporarily modify the rc settings in a "with as" block.
 
@@ -957,6 +1441,10 @@ class rc_configurator(object):
 
         Other parameters
         ----------------
+        style : str, optional
+            The name of a style registered with
+            `~rc_configurator.register_style`. Its settings are applied
+            before the other settings.
         mode : {0,1,2}, optional
             The context mode. Dictates the behavior of `~rc_configurator.get`,
             `~rc_configurator.fill`, and `~rc_configurator.category` within a
@@ -977,6 +1465,16 @@ class rc_configurator(object):
             2. All unchanged settings return ``None``. This is used during user
                calls to `~proplot.axes.Axes.format`.
 
+        Note
+        ----
+        The settings only apply to the thread or asyncio task that entered
+        the block, both when read with `rc` and when matplotlib reads
+        `rcParams <https://matplotlib.org/users/customizing.html>`__, so
+        figures can be drawn concurrently with different settings. The
+        global settings are not modified. The color codes changed by
+        :rcraw:`cycle` and the inline backend format are the exception,
+        since matplotlib and ipython store them globally.
+
         Example
         -------
         The below applies settings to axes in a specific figure using
@@ -1001,7 +1499,16 @@ class rc_configurator(object):
             if not isinstance(arg, dict):
                 raise ValueError('Non-dictionary argument {arg!r}.')
             kwargs.update(arg)
-        self._context.append((mode, kwargs, {}, {}))
+        if style is not None:
+            try:
+                style = _rc_styles[style]
+            except KeyError:
+                raise ValueError(
+                    f'Invalid style {style!r}. Options are: '
+                    + ', '.join(map(repr, _rc_styles)) + '.'
+                )
+        block = _RcBlock(mode, kwargs, style)
+        _rc_context.set((*_rc_context.get(), block))
         return self
 
     def dict(self):
@@ -1066,10 +1573,56 @@ class rc_configurator(object):
         for key in self:
             yield key
 
-    def update(self, *args, **kwargs):
+    def register_style(self, name, *args, **kwargs):
+        """
+        Register a named set of settings that can be applied with
+        ``rc.context(style=name)``. The synced settings are resolved
+        once and stored as a frozen snapshot, so applying the style does not
+        repeat this work.
+
+        Parameters
+        ----------
+        name : str
+            The style name. Existing styles with this name are overwritten.
+        *args, **kwargs
+            Dictionaries of `rc` names and values, or `rc` names and values
+            passed as keyword arguments. If the name has dots, simply omit
+            them.
+
+        Note
+        ----
+        Settings that depend on other settings, like the minor tick lengths,
+        which depend on :rcraw:`ticklen` and :rcraw:`ticklenratio`, are
+        resolved using the current settings if the style does not
+        specify them.
+
+        Example
+        -------
+
+        >>> import proplot as plot
+        >>> plot.rc.register_style('paper', linewidth=0.8, small=7, large=8)
+        >>> with plot.rc.context(style='paper'):
+        ...     f, ax = plot.subplots()
+
+        """
+        if not isinstance(name, str):
+            raise ValueError(f'Invalid style name {name!r}. Must be string.')
+        for arg in args:
+            if not isinstance(arg, dict):
+                raise ValueError(f'Non-dictionary argument {arg!r}.')
+            kwargs.update(arg)
+        with _rc_lock:
+            snapshot = _get_synced_batch(kwargs)
+        _rc_styles[name] = tuple(
+            MappingProxyType(_copy_params(rcdict)) for rcdict in snapshot
+        )
+
+    def update(self, *args, dryrun=False, **kwargs):
         """
         Update several settings at once with a dictionary and/or
-        keyword arguments.
+        keyword arguments. The settings are validated and their synced
+        settings are resolved all at once before anything is applied, so
+        either all of the settings are changed or none of them are.
 
         Parameters
         ----------
@@ -1079,9 +1632,21 @@ class rc_configurator(object):
             settings are prepended with ``'category.'``. For example,
             ``rc.update('axes', labelsize=20, titlesize=20)`` changes the
             :rcraw:`axes.labelsize` and :rcraw:`axes.titlesize` properties.
+        dryrun : bool, optional
+            If ``True``, the settings are not applied. Instead, a dictionary
+            of the settings that would change is returned.
         **kwargs, optional
             `rc` keys and values passed as keyword arguments. If the
             name has dots, simply omit them.
+
+        Returns
+        -------
+        dict or None
+            If `dryrun` is ``True``, this is a dictionary whose keys are the
+            names of the `rcParams \
+<https://matplotlib.org/users/customizing.html>`__, :ref:`rcParamsLong`,
+            and :ref:`rcParamsShort` settings that would change and whose
+            values are ``(old, new)`` tuples.
         """
         # Parse args
         kw = {}
@@ -1100,12 +1665,23 @@ class rc_configurator(object):
                 prefix = args[0]
             else:
                 kw = args[0]
-        # Apply settings
+        # Resolve settings
         if prefix:
             prefix = prefix + '.'
-        kw.update(kwargs)
-        for key, value in kw.items():
-            self[prefix + key] = value
+        kw = {prefix + key: value for key, value in {**kw, **kwargs}.items()}
+        with _rc_lock:
+            rc_short, rc_long, rc = _get_synced_batch(kw)
+            if not dryrun:
+                self._update_params(rc_short, rc_long, rc)
+                return
+        # Return changes
+        changes = {}
+        for newdict in (rc_short, rc_long, rc):
+            for key, value in newdict.items():
+                old = _get_param(key)
+                if not _is_equal(old, value):
+                    changes[key] = (old, value)
+        return changes
 
     def reset(self, **kwargs):
         """
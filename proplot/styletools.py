@@ -10,9 +10,13 @@ for details.
 # Potential bottleneck, loading all this stuff?  *No*. Try using @timer on
 # register functions, turns out worst is colormap one at 0.1 seconds.
 import os
+import io
 import re
+import copy
 import json
 import glob
+import functools
+import concurrent.futures
 import cycler
 from xml.etree import ElementTree
 from numbers import Number, Integral
@@ -39,7 +43,7 @@ __all__ = [
     'register_cmaps', 'register_colors', 'register_cycles', 'register_fonts',
     'saturate', 'shade', 'show_cmaps', 'show_channels',
     'show_colors', 'show_colorspaces', 'show_cycles', 'show_fonts',
-    'to_rgb', 'to_xyz',
+    'to_rgb', 'to_rgb_array', 'to_xyz', 'to_xyz_array',
     'Colormap', 'Colors', 'Cycle', 'Norm',
 ]
 
@@ -173,6 +177,9 @@ CMAPS_DIVERGING = tuple(
         ('DryWet', 'WetDry')
     ))
 
+# Identifier at the start of binary colormap files
+CMAP_MAGIC = b'PROPLOT CMAP\n'
+
 # Named color filter props
 COLORS_SPACE = 'hcl'  # color "distincness" is defined with this space
 COLORS_THRESH = 0.10  # bigger number equals fewer colors
@@ -448,6 +455,141 @@ def to_xyz(color, space='hcl', alpha=False):
         return color
 
 
+def to_rgb_array(colors, space='rgb', cycle=None, alpha=False):
+    """
+    Translate a sequence of colors in *any* format and from *any* colorspace
+    to an array of RGB values. This is the batch version of `to_rgb` and the
+    inverse of `to_xyz_array`.
+
+    Parameters
+    ----------
+    colors : list of color-spec or array-like
+        The color specifications. Can be an ``(N, 3)`` or ``(N, 4)`` array
+        of channel values for the `space` colorspace, or a list of anything
+        accepted by `to_rgb`. Named colors and HEX strings are read
+        from the color cache, and the channel values are translated
+        all at once.
+    space : {'rgb', 'hsv', 'hsl', 'hpl', 'hcl'}, optional
+        The colorspace for the input channel values. Ignored for colors
+        that are not containers of numbers.
+    cycle : str or list, optional
+        The registered color cycle name used to interpret colors that
+        look like ``'C0'``, ``'C1'``, etc. Default is :rc:`cycle`.
+    alpha : bool, optional
+        Whether to preserve the opacity channel. Default is ``False``.
+
+    Returns
+    -------
+    colors : ndarray
+        The ``(N, 3)`` array of RGB values or ``(N, 4)`` array
+        of RGBA values.
+    """
+    # Translate strings and (cmap,index) tuples
+    # NOTE: Matplotlib caches to_rgba() results by (color, alpha), so named
+    # colors and HEX strings are usually a single dictionary lookup.
+    named = {}
+    if not isinstance(colors, np.ndarray) or colors.dtype.kind not in 'iuf':
+        colors = list(colors)
+        cache = mcolors.colorConverter.cache
+        for i, color in enumerate(colors):
+            if not isinstance(color, str) and not (
+                np.iterable(color) and len(color) == 2
+            ):
+                continue
+            try:
+                named[i] = dict.__getitem__(cache, (color, None))
+            except (KeyError, TypeError):
+                named[i] = to_rgb(color, cycle=cycle, alpha=True)
+            colors[i] = named[i]
+
+    # Get array of channel values, then pull out the alpha channel
+    if len(colors) == 0:
+        return np.empty((0, 4 if alpha else 3))
+    try:
+        array = np.asarray(colors, dtype=float)
+    except (ValueError, TypeError):  # mixed 3 and 4 channel colors
+        array = np.ones((len(colors), 4))
+        for i, color in enumerate(colors):
+            if np.iterable(color) and len(color) in (3, 4):
+                array[i, :len(color)] = color
+            else:
+                raise ValueError(f'Invalid RGB argument {color!r}.')
+    if array.ndim != 2 or array.shape[1] not in (3, 4):
+        raise ValueError(
+            f'Invalid RGB array with shape {array.shape}. '
+            'Must have shape (N, 3) or (N, 4).'
+        )
+    if array.shape[1] == 3:
+        array = np.concatenate((array, np.ones((array.shape[0], 1))), axis=1)
+    else:
+        array = array.copy()
+
+    # Translate channel values from arbitrary colorspaces
+    mask = np.ones(array.shape[0], dtype=bool)
+    mask[list(named)] = False
+    color = array[mask, :3]
+    if space == 'rgb':
+        scale = (color > 2).any(axis=1)  # scale to within 0-1
+        color[scale, :] /= 255
+    elif space == 'hsv':
+        color = hsluv.hsl_to_rgb_array(color)
+    elif space == 'hpl':
+        color = hsluv.hpluv_to_rgb_array(color)
+    elif space == 'hsl':
+        color = hsluv.hsluv_to_rgb_array(color)
+    elif space == 'hcl':
+        color = hsluv.hcl_to_rgb_array(color)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    array[mask, :3] = color
+
+    # Return RGB or RGBA
+    if alpha:
+        return array
+    else:
+        return array[:, :3]
+
+
+def to_xyz_array(colors, space='hcl', alpha=False):
+    """
+    Translate a sequence of colors in *any* format to an array of channel
+    values in *any* colorspace. This is the batch version of `to_xyz` and the
+    inverse of `to_rgb_array`.
+
+    Parameters
+    ----------
+    colors : list of color-spec or array-like
+        The colors. Sanitized with `to_rgb_array`.
+    space : {'hcl', 'hpl', 'hsl', 'hsv', 'rgb'}, optional
+        The colorspace for the output channel values.
+    alpha : bool, optional
+        Whether to preserve the opacity channel. Default is ``False``.
+
+    Returns
+    -------
+    colors : ndarray
+        The ``(N, 3)`` array of colorspace `space` channel values or
+        ``(N, 4)`` array with an opacity channel.
+    """
+    array = to_rgb_array(colors, alpha=True)
+    if space == 'rgb':
+        pass
+    elif space == 'hsv':
+        array[:, :3] = hsluv.rgb_to_hsl_array(array[:, :3])
+    elif space == 'hpl':
+        array[:, :3] = hsluv.rgb_to_hpluv_array(array[:, :3])
+    elif space == 'hsl':
+        array[:, :3] = hsluv.rgb_to_hsluv_array(array[:, :3])
+    elif space == 'hcl':
+        array[:, :3] = hsluv.rgb_to_hcl_array(array[:, :3])
+    else:
+        raise ValueError(f'Invalid colorspace {space}.')
+    if alpha:
+        return array
+    else:
+        return array[:, :3]
+
+
 def _clip_colors(colors, clip=True, gray=0.2):
     """
     Clip impossible colors rendered in an HSL-to-RGB colorspace conversion.
@@ -638,25 +780,20 @@ def make_mapping_array(N, data, gamma=1.0, inverse=False):
     distance = (xq[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1])
 
     # Scale distances in each segment by input gamma
-    # The ui are starting-points, the ci are counts from that point
-    # over which segment applies (i.e. where to apply the gamma), the relevant
-    # 'segment' is to the *left* of index returned by searchsorted
-    _, uind, cind = np.unique(ind, return_index=True, return_counts=True)
-    for ui, ci in zip(uind, cind):  # length should be N-1
-        # the relevant segment is to *left* of this number
-        gamma = gammas[ind[ui] - 1]
-        if gamma == 1:
-            continue
-        ireverse = False
-        if ci > 1:  # i.e. more than 1 color in this 'segment'
-            # by default want to weight toward a *lower* channel value
-            ireverse = ((y0[ind[ui]] - y1[ind[ui] - 1]) < 0)
-        if inverse:
-            ireverse = (not ireverse)
-        if ireverse:
-            distance[ui:ui + ci] = 1 - (1 - distance[ui:ui + ci])**gamma
-        else:
-            distance[ui:ui + ci] **= gamma
+    # The relevant 'segment' is to the *left* of the index returned by
+    # searchsorted. Gammas, counts, and the direction of the gamma weighting
+    # are gathered for every sample at once, so there is no loop over segments.
+    _, iseg, cseg = np.unique(ind, return_inverse=True, return_counts=True)
+    gamma = gammas[ind - 1]
+    # By default want to weight toward a *lower* channel value, but only
+    # if there is more than 1 color in this 'segment'
+    reverse = (cseg[iseg] > 1) & ((y0[ind] - y1[ind - 1]) < 0)
+    if inverse:
+        reverse = ~reverse
+    reverse &= (gamma != 1)  # unit gamma leaves distances untouched
+    distance = np.where(
+        reverse, 1 - (1 - distance)**gamma, distance**gamma
+    )
 
     # Perform successive linear interpolations all rolled up into one equation
     lut = np.zeros((N,), float)
@@ -668,6 +805,11 @@ def make_mapping_array(N, data, gamma=1.0, inverse=False):
 
 class _Colormap(object):
     """Mixin class used to add some helper methods."""
+    # The (parent, reverse, roll) tuple used to derive the lookup table
+    _lut_parent = None
+    # The lookup table shared with the colormap cached by CmapDict
+    _lut_shared = None
+
     def _get_data(self, ext):
         """
         Return a string containing the colormap colors for saving.
@@ -682,15 +824,20 @@ class _Colormap(object):
         # Get lookup table colors and filter out bad ones
         if not self._isinit:
             self._init()
-        colors = self._lut[:-3, :]
+        colors = np.clip(self._lut[:-3, :], 0, 1)
         # Get data string
+        # NOTE: Format the whole table at once rather than each color. The HEX
+        # strings are read from the hexadecimal dump of the 8-bit channels.
         if ext == 'hex':
-            data = ', '.join(mcolors.to_hex(color) for color in colors)
+            channels = np.round(colors[:, :3] * 255).astype(np.uint8)
+            hexs = channels.tobytes().hex()
+            hexs = np.frombuffer(hexs.encode(), dtype='S6').astype(str)
+            data = '#' + ', #'.join(hexs)
         elif ext in ('txt', 'rgb', 'rgba'):
-            rgb = mcolors.to_rgba if ext == 'rgba' else mcolors.to_rgb
-            data = [rgb(color) for color in colors]
-            data = '\n'.join(','.join(str(num) for num in line)
-                             for line in data)
+            colors = colors if ext == 'rgba' else colors[:, :3]
+            with io.StringIO() as buffer:
+                np.savetxt(buffer, colors, fmt='%.8g', delimiter=',')
+                data = buffer.getvalue().rstrip('\n')
         else:
             raise ValueError(
                 f'Invalid extension {ext!r}. Options are: '
@@ -698,6 +845,47 @@ class _Colormap(object):
             )
         return data
 
+    def _get_parent_lut(self, gammas=()):
+        """
+        Return the lookup table colors derived from the parent colormap
+        registered by `CmapDict`, or ``None`` if the lookup table must be
+        generated from scratch. The parent lookup table is reversed and
+        rolled instead of regenerating the colors from the segment data.
+
+        Parameters
+        ----------
+        gammas : list of str, optional
+            The gamma attributes. The lookup table is only reused if these
+            are unity for both colormaps, since gamma scaling is not
+            symmetric under reversal.
+        """
+        if self._lut_parent is None:
+            return None
+        parent, reverse, roll = self._lut_parent
+        self._lut_parent = None  # only used once
+        if parent.N != self.N:
+            return None
+        if any(
+            np.any(np.atleast_1d(getattr(cmap, attr, 1)) != 1)
+            for cmap in (self, parent) for attr in gammas
+        ):
+            return None
+        if not parent._isinit:
+            parent._init()
+        lut = parent._lut[:-3, :]
+        if reverse:
+            lut = lut[::-1, :]
+        if roll:
+            lut = np.roll(lut, -roll, axis=0)
+        return lut
+
+    def _unshare_lut(self):
+        """Copy the lookup table shared with the colormap cached by `CmapDict`
+        before it is modified in-place."""
+        if self._lut_shared is not None and self._lut is self._lut_shared:
+            self._lut = self._lut.copy()
+        self._lut_shared = None
+
     def _parse_path(self, path, dirname='.', ext=''):
         """
         Parse the user input path.
@@ -760,6 +948,22 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         if alpha is not None:
             self.set_alpha(alpha)
 
+    def _init(self):
+        """As with `~matplotlib.colors.LinearSegmentedColormap`, but reuse
+        the parent colormap lookup table for reversed colormaps."""
+        lut = self._get_parent_lut(gammas=('_gamma',))
+        if lut is None:
+            return super()._init()
+        self._lut = np.ones((self.N + 3, 4), float)
+        self._lut[:-3, :] = lut
+        self._isinit = True
+        self._set_extremes()
+
+    def _set_extremes(self, *args, **kwargs):
+        # Copy shared lookup tables before set_under, set_over, and set_bad
+        self._unshare_lut()
+        return super()._set_extremes(*args, **kwargs)
+
     def _resample(self, N):
         """Return a resampled copy of the colormap with the same name."""
         return self.updated(name=self.name, N=N)
@@ -976,6 +1180,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             Extension              Description
             =====================  ==========================================================
             ``.json`` (default)    JSON database of the channel segment data.
+            ``.cmap``              Binary file with the channel segment data. Fastest to load.
             ``.hex``               Comma-delimited list of HEX strings.
             ``.rgb``, ``.txt``     3-column table of comma-delimited RGB values.
             ``.rgba``              As with ``.rgb``, but with an opacity (or "alpha") column.
@@ -983,9 +1188,9 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         """  # noqa
         dirname = os.path.join('~', '.proplot', 'cmaps')
         filename = self._parse_path(path, dirname, 'json')
-        # Save channel segment data in json file
+        # Save channel segment data in json or binary file
         _, ext = os.path.splitext(filename)
-        if ext[1:] == 'json':
+        if ext[1:] in ('json', 'cmap'):
             # Sanitize segmentdata values
             # Convert np.float to builtin float, np.array to list of lists,
             # and callable to list of lists. We tried encoding func.__code__
@@ -1007,10 +1212,13 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
                 keys = ('cyclic', 'gamma1', 'gamma2', 'space')
             elif isinstance(self, LinearSegmentedColormap):
                 keys = ('cyclic', 'gamma')
-            for key in keys:
-                data[key] = getattr(self, '_' + key)
-            with open(filename, 'w') as file:
-                json.dump(data, file, indent=4)
+            kwargs = {key: getattr(self, '_' + key) for key in keys}
+            if ext[1:] == 'cmap':
+                _write_cmap_file(filename, data, **kwargs)
+            else:
+                data.update(kwargs)
+                with open(filename, 'w') as file:
+                    json.dump(data, file, indent=4)
         # Save lookup table colors
         else:
             data = self._get_data(ext[1:])
@@ -1028,6 +1236,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             The opacity.
         """
         self._segmentdata['alpha'] = [(0, alpha, alpha), (1, alpha, alpha)]
+        self._lut_parent = None
         self._isinit = False
 
     def set_cyclic(self, b):
@@ -1204,6 +1413,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         ``.rgb``               3-column table delimited by commas or consecutive spaces, each column indicating red, blue and green color values.
         ``.xrgb``              As with ``.rgb``, but with 4 columns. The first column indicates the colormap coordinate.
         ``.rgba``, ``.xrgba``  As with ``.rgb``, ``.xrgb``, but with a trailing opacity (or "alpha") column.
+        ``.cmap``              Binary files written by `LinearSegmentedColormap.save` or `ListedColormap.save`. These are memory-mapped rather than parsed.
         =====================  =============================================================================================================================================================================================================
 
         Parameters
@@ -1255,12 +1465,12 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         if (np.iterable(colors[0]) and len(colors[0]) == 2
                 and not isinstance(colors[0], str)):
             coords, colors = zip(*colors)
-        colors = [to_rgb(color, alpha=True) for color in colors]
+        colors = to_rgb_array(colors, alpha=True)
 
         # Build segmentdata
         keys = ('red', 'green', 'blue', 'alpha')
         cdict = {}
-        for key, values in zip(keys, zip(*colors)):
+        for key, values in zip(keys, colors.T):
             cdict[key] = _make_segmentdata_array(values, coords, ratios)
         return LinearSegmentedColormap(name, cdict, **kwargs)
 
@@ -1293,6 +1503,22 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         if alpha is not None:
             self.set_alpha(alpha)
 
+    def _init(self):
+        """As with `~matplotlib.colors.ListedColormap`, but reuse the parent
+        colormap lookup table for reversed and shifted colormaps."""
+        lut = self._get_parent_lut()
+        if lut is None:
+            return super()._init()
+        self._lut = np.zeros((self.N + 3, 4), float)
+        self._lut[:-3, :] = lut
+        self._isinit = True
+        self._set_extremes()
+
+    def _set_extremes(self, *args, **kwargs):
+        # Copy shared lookup tables before set_under, set_over, and set_bad
+        self._unshare_lut()
+        return super()._set_extremes(*args, **kwargs)
+
     def concatenate(self, *args, name=None, N=None, **kwargs):
         """
         Append arbitrary colormaps onto this colormap.
@@ -1322,6 +1548,21 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         colors = [color for cmap in cmaps for color in cmap.colors]
         return self.updated(colors, name, N or len(colors))
 
+    def reversed(self, name=None):
+        """
+        Return a reversed copy of the colormap, as in
+        `~matplotlib.colors.ListedColormap`.
+
+        Parameters
+        ----------
+        name : str, optional
+            The new colormap name. Default is ``self.name + '_r'``.
+        """
+        if name is None:
+            name = self.name + '_r'
+        colors = [*self.colors][::-1]  # ensure list
+        return self.updated(colors, name, self.N)
+
     def save(self, path=None):
         """
         Save the colormap data to a file.
@@ -1338,6 +1579,7 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
             Extension              Description
             =====================  ==========================================================
             ``.hex`` (default)     Comma-delimited list of HEX strings.
+            ``.cmap``              Binary file with the RGBA values. Fastest to load.
             ``.rgb``, ``.txt``     3-column table of comma-delimited RGB values.
             ``.rgba``              As with ``.rgb``, but with an opacity (or "alpha") column.
             =====================  ==========================================================
@@ -1346,9 +1588,14 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         filename = self._parse_path(path, dirname, 'hex')
         # Save lookup table colors
         _, ext = os.path.splitext(filename)
-        data = self._get_data(ext[1:])
-        with open(filename, 'w') as f:
-            f.write(data)
+        if ext[1:] == 'cmap':
+            if not self._isinit:
+                self._init()
+            _write_cmap_file(filename, self._lut[:-3, :])
+        else:
+            data = self._get_data(ext[1:])
+            with open(filename, 'w') as f:
+                f.write(data)
         print(f'Saved colormap to {filename!r}.')
 
     def set_alpha(self, alpha):
@@ -1364,6 +1611,7 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         for color in colors:
             color[3] = alpha
         self.colors = colors
+        self._lut_parent = None
         self._init()
 
     def shifted(self, shift=None, name=None):
@@ -1450,6 +1698,7 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         ``.rgb``               3-column table delimited by commas or consecutive spaces, each column indicating red, blue and green color values.
         ``.xrgb``              As with ``.rgb``, but with 4 columns. The first column indicates the colormap coordinate.
         ``.rgba``, ``.xrgba``  As with ``.rgb``, ``.xrgb``, but with a trailing opacity (or "alpha") column.
+        ``.cmap``              Binary files written by `LinearSegmentedColormap.save` or `ListedColormap.save`. These are memory-mapped rather than parsed.
         =====================  =============================================================================================================================================================================================================
 
         Parameters
@@ -1565,6 +1814,21 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
     def _init(self):
         """As with `~matplotlib.colors.LinearSegmentedColormap`, but convert
         each value in the lookup table from ``self._space`` to RGB."""
+        # Reuse the parent lookup table for reversed colormaps
+        # NOTE: Custom extremes are specified in the HSL space, so these
+        # require generating the HSL lookup table from scratch.
+        lut = None
+        if self._rgba_under is None and self._rgba_over is None:
+            lut = self._get_parent_lut(gammas=('_gamma1', '_gamma2'))
+        if lut is not None:
+            self._lut = np.ones((self.N + 3, 4), float)
+            self._lut[:-3, :] = lut
+            self._isinit = True
+            self._set_extremes()
+            self._lut[-1, :3] = _clip_colors(
+                to_rgb(self._lut[-1, :3], self._space), self._clip)
+            return
+
         # First generate the lookup table
         channels = ('hue', 'saturation', 'luminance')
         # gamma weights *low chroma* and *high luminance*
@@ -1584,8 +1848,7 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         self._set_extremes()  # generally just used end values in segmentdata
         self._isinit = True
         # Now convert values to RGB and clip colors
-        for i in range(self.N + 3):
-            self._lut[i, :3] = to_rgb(self._lut[i, :3], self._space)
+        self._lut[:, :3] = to_rgb_array(self._lut[:, :3], self._space)
         self._lut[:, :3] = _clip_colors(self._lut[:, :3], self._clip)
 
     def _resample(self, N):
@@ -1738,12 +2001,12 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         if (np.iterable(colors[0]) and len(colors[0]) == 2
                 and not isinstance(colors[0], str)):
             coords, colors = zip(*colors)
-        colors = [to_xyz(color, space, alpha=True) for color in colors]
+        colors = to_xyz_array(colors, space, alpha=True)
 
         # Build segmentdata
         keys = ('hue', 'saturation', 'luminance', 'alpha')
         cdict = {}
-        for key, values in zip(keys, zip(*colors)):
+        for key, values in zip(keys, colors.T):
             cdict[key] = _make_segmentdata_array(values, coords, ratios)
         return PerceptuallyUniformColormap(name, cdict, **kwargs)
 
@@ -1831,6 +2094,7 @@ class CmapDict(dict):
         kwargs : dict-like
             The source dictionary.
         """
+        self._derived = {}  # cache of reversed and shifted colormaps
         for key, value in kwargs.items():
             if not isinstance(key, str):
                 raise KeyError(f'Invalid key {key}. Must be string.')
@@ -1843,7 +2107,8 @@ class CmapDict(dict):
 
     def __delitem__(self, key):
         """Delete the item from the list records."""
-        super().__delitem__(self, key)
+        super().__delitem__(key)
+        self._derived.clear()
         try:
             for record in (cmaps, cycles):
                 try:
@@ -1861,7 +2126,14 @@ class CmapDict(dict):
         ``cmap.shifted(180)`` is returned for the colormap registered under
         the name ``cmap[:-8]``. Reversed diverging colormaps can be requested
         with their "reversed" name -- for example, ``'BuRd'`` is equivalent
-        to ``'RdBu_r'``."""
+        to ``'RdBu_r'``.
+
+        Reversed and shifted colormaps are cached until the dictionary is
+        modified, and their lookup tables are derived from the lookup table
+        of the registered colormap rather than regenerated from scratch. Each
+        lookup returns a new copy of the cached colormap. To
+        refresh the cache after modifying a registered colormap in-place,
+        simply register it again."""
         key = self._sanitize_key(key, mirror=True)
         shift = (key[-8:] == '_shifted')
         if shift:
@@ -1870,9 +2142,17 @@ class CmapDict(dict):
         if reverse:
             key = key[:-2]
         value = super().__getitem__(key)  # may raise keyerror
+        if not shift and not reverse:
+            return value
+        parent, derived = self._derived.get(
+            (key, shift, reverse), (None, None)
+        )
+        if parent is value:
+            return self._copy(derived)
+        parent = value
         if shift:
             if hasattr(value, 'shifted'):
-                value = value.shifted(180)
+                value = self._derive(value, value.shifted(180), shift=180)
             else:
                 raise KeyError(
                     f'Item of type {type(value).__name__!r} '
@@ -1880,13 +2160,14 @@ class CmapDict(dict):
                 )
         if reverse:
             if hasattr(value, 'reversed'):
-                value = value.reversed()
+                value = self._derive(value, value.reversed(), reverse=True)
             else:
                 raise KeyError(
                     f'Item of type {type(value).__name__!r} '
                     'does not have reversed() method.'
                 )
-        return value
+        self._derived[(key, shift, reverse)] = (parent, value)
+        return self._copy(value)
 
     def __setitem__(self, key, item, sort=True):
         """Store the colormap under its lowercase name. If the colormap is
@@ -1910,9 +2191,11 @@ class CmapDict(dict):
                 'matplotlib.colors.LinearSegmentedColormap.'
             )
         key = self._sanitize_key(key, mirror=False)
+        self._derived.clear()
         try:
             record = cycles if isinstance(item, ListedColormap) else cmaps
-            record.append(key)
+            if key not in record:
+                record.append(key)
             if sort:
                 record[:] = sorted(record)
         except NameError:
@@ -1951,6 +2234,40 @@ class CmapDict(dict):
             key = key + '_r'
         return key
 
+    @staticmethod
+    def _copy(cmap):
+        """Return a copy of a cached colormap so that changes to one lookup
+        result, e.g. with ``set_under``, do not affect later lookups. The
+        copy shares the lookup table of the cached colormap until it is
+        modified."""
+        if not isinstance(cmap, _Colormap):
+            return copy.copy(cmap)
+        if not cmap._isinit:
+            cmap._init()
+        cls = type(cmap)
+        new = cls.__new__(cls)
+        new.__dict__.update(cmap.__dict__)
+        new._lut_shared = cmap._lut
+        if hasattr(new, '_segmentdata'):  # modified in-place by set_alpha
+            new._segmentdata = dict(new._segmentdata)
+        return new
+
+    @staticmethod
+    def _derive(parent, cmap, reverse=False, shift=0):
+        """Point the reversed or shifted colormap to the lookup table of the
+        parent colormap. The lookup table is derived when it is first used."""
+        if (
+            cmap is not parent and isinstance(cmap, _Colormap)
+            and not cmap._isinit
+        ):
+            roll = 0
+            if shift and isinstance(parent, ListedColormap):
+                roll = shift % len(parent.colors)  # see ListedColormap.shifted
+            elif shift:
+                return cmap  # the shifted() lookup table is different
+            cmap._lut_parent = (parent, reverse, roll)
+        return cmap
+
     def get(self, key, *args):
         """Retrieve the sanitized colormap name."""
         key = self._sanitize_key(key, mirror=True)
@@ -1959,6 +2276,7 @@ class CmapDict(dict):
     def pop(self, key, *args):
         """Pop the sanitized colormap name."""
         key = self._sanitize_key(key, mirror=True)
+        self._derived.clear()
         try:
             for record in (cmaps, cycles):
                 try:
@@ -2188,8 +2506,7 @@ def Colormap(
         elif (not isinstance(cmap, str) and np.iterable(cmap)
               and all(np.iterable(color) for color in cmap)):
             try:
-                colors = [to_rgb(color, cycle=cycle, alpha=True)
-                          for color in cmap]
+                colors = to_rgb_array(cmap, cycle=cycle, alpha=True)
             except (ValueError, TypeError):
                 raise ValueError(f'Invalid color(s) in list {cmap!r}.')
             if listmode == 'listed':
@@ -2806,6 +3123,93 @@ def _get_data_paths(dirname):
     ]
 
 
+def _load_files(filenames, listed=False, max_workers=None, processes=False):
+    """
+    Load colormap and color cycle files, optionally in parallel. The result
+    is always in the same order as the input files.
+
+    Parameters
+    ----------
+    filenames : list of str
+        The file paths.
+    listed : bool, optional
+        Passed to `_from_file`.
+    max_workers : int, optional
+        The number of workers. If ``None`` or ``1``, files are
+        loaded sequentially.
+    processes : bool, optional
+        Whether to use a process pool instead of a thread pool.
+    """
+    load = functools.partial(_from_file, listed=listed, warn_on_failure=True)
+    if not max_workers or max_workers == 1 or len(filenames) < 2:
+        return [load(filename) for filename in filenames]
+    if processes:
+        Executor = concurrent.futures.ProcessPoolExecutor
+    else:
+        Executor = concurrent.futures.ThreadPoolExecutor
+    with Executor(max_workers=max_workers) as executor:
+        return list(executor.map(load, filenames))  # preserves order
+
+
+def _write_cmap_file(filename, data, **kwargs):
+    """
+    Write a binary colormap file. This consists of a magic string, a single
+    line JSON header with the colormap properties, and a ``.npy`` array.
+
+    Parameters
+    ----------
+    filename : str
+        The file path.
+    data : array-like or dict of array-like
+        The RGBA lookup table colors or the channel segment data. The segment
+        data arrays are stacked into one array, and their row ranges are
+        recorded in the header.
+    **kwargs
+        Colormap properties, e.g. `cyclic`, `gamma`, and `space`.
+    """
+    channels = None
+    if isinstance(data, dict):
+        channels, rows, i = {}, [], 0
+        for key, xyy in data.items():
+            xyy = np.asarray(xyy, dtype=float).reshape(-1, 3)
+            channels[key] = (i, i + xyy.shape[0])
+            rows.append(xyy)
+            i += xyy.shape[0]
+        data = np.concatenate(rows, axis=0)
+    header = {'channels': channels, **kwargs}
+    with open(filename, 'wb') as f:
+        f.write(CMAP_MAGIC)
+        f.write(json.dumps(
+            header, default=lambda x: np.asarray(x).tolist()
+        ).encode() + b'\n')
+        np.lib.format.write_array(
+            f, np.ascontiguousarray(data, dtype=float), allow_pickle=False
+        )
+
+
+def _read_cmap_file(filename):
+    """
+    Read a binary colormap file written by `_write_cmap_file`. Returns the
+    memory-mapped array and the header dictionary. The array is copy-on-write,
+    so colormaps can modify their segment data without touching the file.
+    """
+    with open(filename, 'rb') as f:
+        if f.readline() != CMAP_MAGIC:
+            raise ValueError('Missing binary colormap file identifier.')
+        header = json.loads(f.readline().decode())
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    data = np.memmap(
+        filename, dtype=dtype, mode='c', offset=offset, shape=shape,
+        order='F' if fortran else 'C'
+    )
+    return data.view(np.ndarray), header  # skip slow memmap indexing
+
+
 def _from_file(filename, listed=False, warn_on_failure=False):
     """Read generalized colormap and color cycle files."""
     filename = os.path.expanduser(filename)
@@ -2829,24 +3233,34 @@ def _from_file(filename, listed=False, warn_on_failure=False):
     name, ext = os.path.splitext(os.path.basename(filename))
     ext = ext[1:]
     cmap = None
+    segmentdata = None
     if ext == 'json':
         try:
             with open(filename, 'r') as f:
-                data = json.load(f)
+                segmentdata = json.load(f)
         except json.JSONDecodeError:
             _warn_or_raise(
                 f'Failed to load {filename!r}.', json.JSONDecodeError
             )
             return
-        kw = {}
-        for key in ('cyclic', 'gamma', 'gamma1', 'gamma2', 'space'):
-            kw[key] = data.pop(key, None)
-        if 'red' in data:
-            cmap = LinearSegmentedColormap(name, data, N=N)
+
+    # Memory-map binary files containing segment data or lookup table colors
+    elif ext == 'cmap':
+        try:
+            data, header = _read_cmap_file(filename)
+        except (ValueError, OSError):
+            _warn_or_raise(
+                f'Failed to load {filename!r}. Invalid binary colormap file.'
+            )
+            return
+        channels = header.pop('channels', None)
+        if channels is None:
+            x = np.linspace(0, 1, data.shape[0])
         else:
-            cmap = PerceptuallyUniformColormap(name, data, N=N, **kw)
-        if name[-2:] == '_r':
-            cmap = cmap.reversed(name[:-2])
+            segmentdata = {
+                key: data[i:j, :] for key, (i, j) in channels.items()
+            }
+            segmentdata.update(header)
 
     # Read .rgb, .rgba, .xrgb, and .xrgba files
     elif ext in ('txt', 'rgb', 'xrgb', 'rgba', 'xrgba'):
@@ -2930,13 +3344,30 @@ def _from_file(filename, listed=False, warn_on_failure=False):
             return
         # Convert to array
         x = np.linspace(0, 1, len(data))
-        data = [to_rgb(color) for color in data]
+        data = to_rgb_array(data)
     else:
         _warn_or_raise(
             f'Colormap or cycle file {filename!r} has unknown extension.'
         )
         return
 
+    # Build colormap from segment data
+    if segmentdata is not None:
+        kw = {}
+        for key in ('cyclic', 'gamma', 'gamma1', 'gamma2', 'space'):
+            kw[key] = segmentdata.pop(key, None)
+        if 'red' in segmentdata:
+            cmap = LinearSegmentedColormap(
+                name, segmentdata, N=N,
+                gamma=_notNone(kw['gamma'], 1.0), cyclic=bool(kw['cyclic'])
+            )
+        else:
+            cmap = PerceptuallyUniformColormap(
+                name, segmentdata, N=N, **kw
+            )
+        if name[-2:] == '_r':
+            cmap = cmap.reversed(name[:-2])
+
     # Standardize and reverse if necessary to cmap
     # TODO: Document the fact that filenames ending in _r return a reversed
     # version of the colormap stored in that file.
@@ -2961,7 +3392,7 @@ def _from_file(filename, listed=False, warn_on_failure=False):
 
 
 @_timer
-def register_cmaps():
+def register_cmaps(max_workers=None, processes=False):
     """
     Register colormaps packaged with ProPlot or saved to the
     ``~/.proplot/cmaps`` folder. This is called on import. Maps are registered
@@ -2970,21 +3401,36 @@ def register_cmaps():
 
     For a table of valid extensions, see `LinearSegmentedColormap.from_file`.
     To visualize the registered colormaps, use `show_cmaps`.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        If greater than ``1``, files are parsed concurrently using this many
+        workers. Colormaps are still registered in the same order as when
+        files are loaded sequentially, so files in ``~/.proplot/cmaps``
+        always overwrite files packaged with ProPlot.
+    processes : bool, optional
+        Whether to parse files with a process pool rather than a thread
+        pool. This may be faster for very large colormap libraries.
     """
-    for i, path in enumerate(_get_data_paths('cmaps')):
-        for filename in sorted(glob.glob(os.path.join(path, '*'))):
-            cmap = LinearSegmentedColormap.from_file(
-                filename, warn_on_failure=True
-            )
-            if not cmap:
-                continue
-            if i == 0 and cmap.name.lower() in ('phase', 'graycycle'):
-                cmap._cyclic = True
-            mcm.cmap_d[cmap.name] = cmap
+    paths = [
+        (i, filename) for i, path in enumerate(_get_data_paths('cmaps'))
+        for filename in sorted(glob.glob(os.path.join(path, '*')))
+    ]
+    loaded = _load_files(
+        [filename for _, filename in paths],
+        max_workers=max_workers, processes=processes
+    )
+    for (i, _), cmap in zip(paths, loaded):
+        if not cmap:
+            continue
+        if i == 0 and cmap.name.lower() in ('phase', 'graycycle'):
+            cmap._cyclic = True
+        mcm.cmap_d[cmap.name] = cmap
 
 
 @_timer
-def register_cycles():
+def register_cycles(max_workers=None, processes=False):
     """
     Register color cycles packaged with ProPlot or saved to the
     ``~/.proplot/cycles`` folder. This is called on import. Cycles are
@@ -2994,18 +3440,26 @@ def register_cycles():
 
     For a table of valid extensions, see `ListedColormap.from_file`.
     To visualize the registered colormaps, use `show_cmaps`.
+
+    Parameters
+    ----------
+    max_workers, processes : optional
+        See `register_cmaps`.
     """
-    for path in _get_data_paths('cycles'):
-        for filename in sorted(glob.glob(os.path.join(path, '*'))):
-            cmap = ListedColormap.from_file(
-                filename, warn_on_failure=True
-            )
-            if not cmap:
-                continue
-            if isinstance(cmap, LinearSegmentedColormap):
-                cmap = ListedColormap(colors(cmap), name=cmap.name)
-            mcm.cmap_d[cmap.name] = cmap
-            cycles.append(cmap.name)
+    filenames = [
+        filename for path in _get_data_paths('cycles')
+        for filename in sorted(glob.glob(os.path.join(path, '*')))
+    ]
+    loaded = _load_files(
+        filenames, listed=True, max_workers=max_workers, processes=processes
+    )
+    for cmap in loaded:
+        if not cmap:
+            continue
+        if isinstance(cmap, LinearSegmentedColormap):
+            cmap = ListedColormap(colors(cmap), name=cmap.name)
+        mcm.cmap_d[cmap.name] = cmap
+        cycles.append(cmap.name)
 
 
 @_timer
@@ -3037,7 +3491,6 @@ def register_colors(nmax=np.inf):
     # Load colors from file and get their HCL values
     dicts = {}
     seen = {*base}  # never overwrite base names, e.g. 'blue' and 'b'!
-    hcls = []
     data = []
     for i, path in enumerate(_get_data_paths('colors')):
         if i == 0:
@@ -3090,12 +3543,13 @@ def register_colors(nmax=np.inf):
                 if name in seen or COLORS_IGNORE.search(name):
                     continue
                 seen.add(name)
-                hcls.append(to_xyz(color, space=COLORS_SPACE))
                 data.append((cat, name, color))  # category name pair
 
     # Remove colors that are 'too similar' by rounding to the nearest n units
     # WARNING: Unique axis argument requires numpy version >=1.13
-    hcls = np.array(hcls)
+    hcls = to_xyz_array(
+        [color for _, _, color in data], space=COLORS_SPACE
+    )
     if hcls.size > 0:
         hcls = hcls / np.array([360, 100, 100])
         hcls = np.round(hcls / COLORS_THRESH).astype(np.int64)
@@ -3301,10 +3755,9 @@ def show_channels(
         x = np.linspace(0, 1, N)
         lut = cmap._lut[:-3, :3].copy()
         rgb_data = lut.T  # 3 by N
-        hcl_data = np.array([to_xyz(color, space='hcl')
-                             for color in lut]).T  # 3 by N
-        hsl_data = [to_xyz(color, space='hsl')[1] for color in lut]
-        hpl_data = [to_xyz(color, space='hpl')[1] for color in lut]
+        hcl_data = to_xyz_array(lut, space='hcl').T  # 3 by N
+        hsl_data = to_xyz_array(lut, space='hsl')[:, 1]
+        hpl_data = to_xyz_array(lut, space='hpl')[:, 1]
         # Plot channels
         # If rgb is False, the zip will just truncate the other iterables
         data = (*hcl_data,)
@@ -3422,14 +3875,11 @@ def show_colorspaces(luminance=None, saturation=None, hue=None, axwidth=2):
         ncols=3, share=0, axwidth=axwidth, aspect=1, axpad=0.05
     )
     for ax, space in zip(axs, ('hcl', 'hsl', 'hpl')):
-        rgba = np.ones((*hsl.shape[:2][::-1], 4))  # RGBA
-        for j in range(hsl.shape[0]):
-            for k in range(hsl.shape[1]):
-                rgb_jk = to_rgb(hsl[j, k, :].flat, space)
-                if not all(0 <= c <= 1 for c in rgb_jk):
-                    rgba[k, j, 3] = 0  # black cell
-                else:
-                    rgba[k, j, :3] = rgb_jk
+        rgba = to_rgb_array(hsl.reshape(-1, 3), space, alpha=True)
+        rgba = rgba.reshape((*hsl.shape[:2], 4)).transpose(1, 0, 2)
+        invalid = ~((rgba[..., :3] >= 0) & (rgba[..., :3] <= 1)).all(axis=2)
+        rgba[invalid, :3] = 1
+        rgba[invalid, 3] = 0  # black cell
         ax.imshow(rgba, origin='lower', aspect='auto')
         ax.format(
             xlabel=xlabel, ylabel=ylabel, suptitle=suptitle,
@@ -3503,10 +3953,9 @@ def show_colors(nhues=17, minsat=20):
             ncols = 4
             wscale = 0.8
             swatch = 1.2
-            hclpairs = [
-                (name, to_xyz(color, COLORS_SPACE))
-                for name, color in data.items()
-            ]
+            hclpairs = [*zip(
+                data.keys(), to_xyz_array([*data.values()], COLORS_SPACE)
+            )]
             hclpairs = [
                 sorted(
                     [pair for pair in hclpairs if _color_filter(i, pair[1])],
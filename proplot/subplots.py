@@ -6,24 +6,33 @@ pyplot-inspired functions for creating figures and related classes.
 # NOTE: Importing backend causes issues with sphinx, and anyway not sure it's
 # always included, so make it optional
 import os
+import sys
+import weakref
 import numpy as np
 import functools
+import collections
 import inspect
+import concurrent.futures
+import matplotlib.cm as mcm
 import matplotlib.pyplot as plt
+import matplotlib.axis as maxis
 import matplotlib.figure as mfigure
+import matplotlib.legend as mlegend
+import matplotlib.text as mtext
 import matplotlib.transforms as mtransforms
 import matplotlib.gridspec as mgridspec
-from numbers import Integral
-from .rctools import rc
+from numbers import Integral, Number
+from .rctools import rc, _get_settings, _set_settings
 from .utils import _warn_proplot, _notNone, _counter, _setstate, units  # noqa
-from . import projs, axes
+from .utils import _benchmark
+from . import projs, axes, utils
 try:  # use this for debugging instead of print()!
     from icecream import ic
 except ImportError:  # graceful fallback if IceCream isn't installed
     ic = lambda *a: None if not a else (a[0] if len(a) == 1 else a)  # noqa
 
 __all__ = [
-    'subplot_grid', 'close', 'show', 'subplots', 'Figure',
+    'subplot_grid', 'close', 'show', 'subplots', 'render_batch', 'Figure',
     'GridSpec', 'SubplotSpec',
 ]
 
@@ -55,6 +64,35 @@ JOURNAL_SPECS = {
 }
 
 
+# Figures tracked when rc['subplots.maxfigs'] is set, in least recently
+# used order. Maps id(figure) to weak references.
+_managed_figures = collections.OrderedDict()
+
+
+def _manage_figure(fig):
+    """Track a figure created by `subplots` and close the least recently
+    used figures if there are more than :rc:`subplots.maxfigs`. A limit
+    of zero disables the tracking."""
+    maxfigs = rc['subplots.maxfigs']
+    if not maxfigs:
+        return
+    key = id(fig)
+    _managed_figures[key] = weakref.ref(
+        fig, lambda _, key=key: _managed_figures.pop(key, None)
+    )
+    for key, ref in tuple(_managed_figures.items()):  # ignore closed figures
+        ifig = ref()
+        num = getattr(ifig, 'number', None)
+        if ifig is None or not plt.fignum_exists(num):
+            _managed_figures.pop(key, None)
+    while len(_managed_figures) > max(1, int(maxfigs)):
+        _, ref = _managed_figures.popitem(last=False)
+        ifig = ref()
+        if ifig is not None:
+            plt.close(ifig)
+            ifig._release()
+
+
 def close(*args, **kwargs):
     """Pass the input arguments to `matplotlib.pyplot.close`. This is included
     so you don't have to import `~matplotlib.pyplot`."""
@@ -70,6 +108,10 @@ def show():
     plt.show()
 
 
+# Docstrings for subplot_grid dispatchers, keyed by the method function
+_dispatcher_docs = {}
+
+
 class subplot_grid(list):
     """List subclass and pseudo-2d array that is used as a container for the
     list of axes returned by `subplots`. See `~subplot_grid.__getattr__`
@@ -96,6 +138,7 @@ class subplot_grid(list):
         super().__init__(objs)
         self._n = n
         self._order = order
+        self._dispatchers = {}  # see __getattr__
         self._shape = (len(self) // n, n)[::(1 if order == 'C' else -1)]
 
     def __repr__(self):
@@ -207,6 +250,10 @@ class subplot_grid(list):
             raise AttributeError(
                 f'Invalid attribute {attr!r}, axes grid {self!r} is empty.'
             )
+        try:
+            return self._dispatchers[attr]
+        except KeyError:
+            pass
         objs = (*(getattr(ax, attr) for ax in self),)  # may raise error
 
         # Objects
@@ -217,12 +264,14 @@ class subplot_grid(list):
                 return objs
         # Methods
         # NOTE: Must manually copy docstring because help() cannot inherit it
+        # NOTE: The methods are looked up when the dispatcher is called, so
+        # cached dispatchers also work after the list is modified in-place.
         elif all(callable(_) for _ in objs):
             @functools.wraps(objs[0])
             def _iterator(*args, **kwargs):
                 ret = []
-                for func in objs:
-                    ret.append(func(*args, **kwargs))
+                for ax in self:
+                    ret.append(getattr(ax, attr)(*args, **kwargs))
                 ret = (*ret,)
                 if len(self) == 1:
                     return ret[0]
@@ -232,12 +281,39 @@ class subplot_grid(list):
                     return subplot_grid(ret, n=self._n, order=self._order)
                 else:
                     return ret
-            _iterator.__doc__ = inspect.getdoc(objs[0])
+            # Cache the dispatcher if the attributes are ordinary methods,
+            # since these cannot change. Other callables may be reassigned.
+            if all(
+                inspect.ismethod(obj) and attr not in vars(ax)
+                for ax, obj in zip(self, objs)
+            ):
+                func = objs[0].__func__
+                if func not in _dispatcher_docs:
+                    _dispatcher_docs[func] = inspect.getdoc(objs[0])
+                _iterator.__doc__ = _dispatcher_docs[func]
+                self._dispatchers[attr] = _iterator
+            else:
+                _iterator.__doc__ = inspect.getdoc(objs[0])
             return _iterator
 
         # Mixed
         raise AttributeError(f'Found mixed types for attribute {attr!r}.')
 
+    def format(self, **kwargs):
+        """
+        Call `~proplot.axes.Axes.format` for every axes in the grid. The
+        `~proplot.rctools.rc` settings are parsed and applied once for the
+        whole grid rather than once for each axes.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed to `~proplot.axes.Axes.format`.
+        """
+        rc_kw, rc_mode, kwargs = axes._parse_format(**kwargs)
+        with rc.context(rc_kw, mode=rc_mode):
+            return self.__getattr__('format')(**kwargs)
+
     @property
     def shape(self):
         """The "shape" of the subplot grid. For complex subplot grids, where
@@ -421,15 +497,15 @@ class GridSpec(mgridspec.GridSpec):
 
         # Assign spacing as ratios
         nrows, ncols = self.get_geometry()
-        wratios_final = [None] * ncols
-        wratios_final[::2] = [*wratios]
-        if ncols > 1:
-            wratios_final[1::2] = [*wspace]
-        hratios_final = [None] * nrows
-        hratios_final[::2] = [*hratios]
-        if nrows > 1:
-            hratios_final[1::2] = [*hspace]
-        return wratios_final, hratios_final, kwargs  # bring extra kwargs back
+        wratios_final = np.empty(ncols)
+        wratios_final[::2] = wratios
+        wratios_final[1::2] = wspace
+        hratios_final = np.empty(nrows)
+        hratios_final[::2] = hratios
+        hratios_final[1::2] = hspace
+        return (  # bring extra kwargs back
+            wratios_final.tolist(), hratios_final.tolist(), kwargs
+        )
 
     def get_margins(self):
         """Returns left, bottom, right, top values. Not sure why this method
@@ -536,24 +612,81 @@ def _canvas_preprocess(canvas, method):
         if fig._is_preprocessing:
             return
         with fig._context_preprocessing():
-            renderer = fig._get_renderer()  # any renderer will do for now
-            for ax in fig._iter_axes():
-                ax._draw_auto_legends_colorbars()  # may insert panels
-            resize = rc['backend'] != 'nbAgg'
-            if resize:
-                fig._adjust_aspect()  # resizes figure
-            if fig._auto_tight:
-                fig._adjust_tight_layout(renderer, resize=resize)
-            fig._align_axislabels(True)
-            fig._align_labels(renderer)
-            fallback = _notNone(
-                fig._fallback_to_cm, rc['mathtext.fallback_to_cm']
-            )
-            with rc.context({'mathtext.fallback_to_cm': fallback}):
+            fig._update_layout()
+            with fig._context_fallback_to_cm():
                 return getattr(type(self), method)(self, *args, **kwargs)
     return _preprocess.__get__(canvas)  # ...I don't get it either
 
 
+def _text_fingerprint(text):
+    """Return the properties of a `~matplotlib.text.Text` instance that
+    affect its extent. Positions are omitted because they are set during
+    the draw."""
+    return (
+        text.get_text(), hash(text.get_fontproperties()),
+        text.get_rotation(), text.get_visible(),
+    )
+
+
+def _legend_fingerprint(legend):
+    """Return the properties of a `~matplotlib.legend.Legend` instance that
+    affect its extent and position."""
+    return (
+        legend.get_visible(), legend._loc,
+        tuple(legend.get_bbox_to_anchor().bounds),
+        *map(_text_fingerprint, (*legend.texts, legend.get_title())),
+    )
+
+
+# Locator and formatter attributes that matplotlib sets while drawing, e.g.
+# in Formatter.set_locs. These are ignored by _ticker_fingerprint.
+_ticker_draw_attrs = (
+    'axis', 'locs', 'format', 'offset', 'orderOfMagnitude',
+    'sublabels', 'offset_string',
+)
+
+
+def _ticker_fingerprint(ticker):
+    """Return a `~matplotlib.ticker.Locator` or `~matplotlib.ticker.Formatter`
+    instance and a copy of its simple attributes, so that changes made
+    in-place (e.g. with ``set_powerlimits``) are detected."""
+    def _simple(value):
+        return value is None or isinstance(value, (str, Number))
+    items = []
+    for key, value in vars(ticker).items():
+        if key.lstrip('_') in _ticker_draw_attrs:
+            continue
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        if isinstance(value, (tuple, list)) and all(map(_simple, value)):
+            value = tuple(value)
+        elif not _simple(value):  # e.g. the axis, functions, nested objects
+            continue
+        items.append((key, value))
+    return (ticker, items)
+
+
+def _axis_fingerprint(axis):
+    """Return the properties of a `~matplotlib.axis.Axis` instance that
+    affect its tick label extents. The tick labels themselves are not
+    generated, so the locators and formatters are compared instead."""
+    tick = axis.majorTicks[0]
+    return (
+        axis.get_visible(), axis.get_scale(),
+        tuple(axis.get_view_interval()),
+        *map(_ticker_fingerprint, (
+            axis.get_major_locator(), axis.get_major_formatter(),
+            axis.get_minor_locator(), axis.get_minor_formatter(),
+        )),
+        axis.get_label_position(), _text_fingerprint(axis.label),
+        tick.get_pad(), tick.get_tick_padding(),
+        *(
+            (hash(t.get_fontproperties()), t.get_rotation(), t.get_visible())
+            for t in (tick.label1, tick.label2)
+        ),
+    )
+
+
 def _get_panelargs(
     side, share=None, width=None, space=None,
     filled=False, figure=False
@@ -613,183 +746,221 @@ def _get_space(key, share=0, pad=None):
     return space
 
 
-def _subplots_geometry(**kwargs):
-    """Save arguments passed to `subplots`, calculates gridspec settings and
-    figure size necessary for requested geometry, and returns keyword args
-    necessary to reconstruct and modify this configuration. Note that
-    `wspace`, `hspace`, `left`, `right`, `top`, and `bottom` always have fixed
-    physical units, then we scale figure width, figure height, and width
-    and height ratios to accommodate spaces."""
-    # Dimensions and geometry
-    nrows, ncols = kwargs['nrows'], kwargs['ncols']
-    aspect, xref, yref = kwargs['aspect'], kwargs['xref'], kwargs['yref']
-    width, height = kwargs['width'], kwargs['height']
-    axwidth, axheight = kwargs['axwidth'], kwargs['axheight']
-    # Gridspec settings
-    wspace, hspace = kwargs['wspace'], kwargs['hspace']
-    wratios, hratios = kwargs['wratios'], kwargs['hratios']
-    left, bottom = kwargs['left'], kwargs['bottom']
-    right, top = kwargs['right'], kwargs['top']
-    # Panel string toggles, lists containing empty strings '' (indicating a
-    # main axes), or one of 'l', 'r', 'b', 't' (indicating axes panels) or
-    # 'f' (indicating figure panels)
-    wpanels, hpanels = kwargs['wpanels'], kwargs['hpanels']
-
-    # Checks, important now that we modify gridspec geometry
-    if len(hratios) != nrows:
-        raise ValueError(
-            f'Expected {nrows} width ratios for {nrows} rows, '
-            f'got {len(hratios)}.'
-        )
-    if len(wratios) != ncols:
-        raise ValueError(
-            f'Expected {ncols} width ratios for {ncols} columns, '
-            f'got {len(wratios)}.'
-        )
-    if len(hspace) != nrows - 1:
-        raise ValueError(
-            f'Expected {nrows - 1} hspaces for {nrows} rows, '
-            f'got {len(hspace)}.'
-        )
-    if len(wspace) != ncols - 1:
-        raise ValueError(
-            f'Expected {ncols - 1} wspaces for {ncols} columns, '
-            f'got {len(wspace)}.'
-        )
-    if len(hpanels) != nrows:
-        raise ValueError(
-            f'Expected {nrows} hpanel toggles for {nrows} rows, '
-            f'got {len(hpanels)}.'
+class _SubplotsGeometry(dict):
+    """Dictionary of arguments passed to `subplots` that solves for the
+    gridspec settings and figure size necessary for the requested geometry.
+    Note that `wspace`, `hspace`, `left`, `right`, `top`, and `bottom` always
+    have fixed physical units, then we scale figure width, figure height, and
+    width and height ratios to accommodate spaces. The ratios and spaces are
+    stored as arrays along with the indices of the main subplot slots, so
+    re-solving the geometry does not have to loop over rows and columns."""
+    # NOTE: Panel string toggles are arrays containing empty strings ''
+    # (indicating a main axes), or one of 'l', 'r', 'b', 't' (indicating axes
+    # panels) or 'f' (indicating figure panels)
+    def __init__(self, **kwargs):
+        super().__init__()
+        self._idxs = {}
+        self.update(kwargs)
+
+    def __setitem__(self, key, value):
+        if key in ('wratios', 'hratios', 'wspace', 'hspace'):
+            value = np.array(value, dtype=float)
+        elif key in ('wpanels', 'hpanels'):
+            value = np.array(value, dtype='<U1')
+        super().__setitem__(key, value)
+        if key in ('wpanels', 'hpanels'):
+            self._update_idxs(key[0])
+
+    def _update_idxs(self, w):
+        """Update the indices for the main subplot slots, the panel slots, and
+        the spaces between main subplot slots along the row (``'h'``) or
+        column (``'w'``) dimension."""
+        panels = self[w + 'panels']
+        mask = (panels == '')
+        idxs_ratio, = np.where(mask)
+        idxs_panel, = np.where(~mask)
+        # The main space after each main slot except the last is the slot
+        # preceding the next main slot or "right", "bottom", or figure panel
+        stops, = np.where(np.isin(panels, ('', 'r', 'b', 'f')))
+        idxs_space = stops[
+            np.searchsorted(stops, idxs_ratio[:-1], side='right')
+        ] - 1
+        self._idxs[w] = (idxs_ratio, idxs_panel, idxs_space)
+
+    def update(self, *args, **kwargs):
+        # Apply conversions in __setitem__
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def insert(self, w, idx, idx_space, ratio, space, panel):
+        """Insert a panel row (``'h'``) or column (``'w'``) at the ratio
+        index `idx` and the space index `idx_space`."""
+        dict.__setitem__(
+            self, w + 'ratios', np.insert(self[w + 'ratios'], idx, ratio)
         )
-    if len(wpanels) != ncols:
-        raise ValueError(
-            f'Expected {ncols} wpanel toggles for {ncols} columns, '
-            f'got {len(wpanels)}.'
+        dict.__setitem__(
+            self, w + 'space', np.insert(self[w + 'space'], idx_space, space)
         )
+        self[w + 'panels'] = np.insert(self[w + 'panels'], idx, panel)
+        self['ncols' if w == 'w' else 'nrows'] += 1
+
+    def solve(self, figsize=None):
+        """Return the figure size and the `GridSpec` keyword arguments.
+        The ratios for the main subplot slots are replaced with their
+        physical sizes. If `figsize` is passed it overrides the stored
+        figure width and height."""
+        # Dimensions and geometry
+        nrows, ncols = self['nrows'], self['ncols']
+        aspect, xref, yref = self['aspect'], self['xref'], self['yref']
+        width, height = figsize or (self['width'], self['height'])
+        axwidth, axheight = self['axwidth'], self['axheight']
+        # Gridspec settings
+        wspace, hspace = self['wspace'], self['hspace']
+        wratios, hratios = self['wratios'], self['hratios']
+        left, bottom = self['left'], self['bottom']
+        right, top = self['right'], self['top']
+
+        # Checks, important now that we modify gridspec geometry
+        if len(hratios) != nrows:
+            raise ValueError(
+                f'Expected {nrows} width ratios for {nrows} rows, '
+                f'got {len(hratios)}.'
+            )
+        if len(wratios) != ncols:
+            raise ValueError(
+                f'Expected {ncols} width ratios for {ncols} columns, '
+                f'got {len(wratios)}.'
+            )
+        if len(hspace) != nrows - 1:
+            raise ValueError(
+                f'Expected {nrows - 1} hspaces for {nrows} rows, '
+                f'got {len(hspace)}.'
+            )
+        if len(wspace) != ncols - 1:
+            raise ValueError(
+                f'Expected {ncols - 1} wspaces for {ncols} columns, '
+                f'got {len(wspace)}.'
+            )
+        if len(self['hpanels']) != nrows:
+            raise ValueError(
+                f'Expected {nrows} hpanel toggles for {nrows} rows, '
+                f'got {len(self["hpanels"])}.'
+            )
+        if len(self['wpanels']) != ncols:
+            raise ValueError(
+                f'Expected {ncols} wpanel toggles for {ncols} columns, '
+                f'got {len(self["wpanels"])}.'
+            )
 
-    # Get indices corresponding to main axes or main axes space slots
-    idxs_ratios, idxs_space = [], []
-    for panels in (hpanels, wpanels):
-        # Ratio indices
-        mask = np.array([bool(s) for s in panels])
-        ratio_idxs, = np.where(~mask)
-        idxs_ratios.append(ratio_idxs)
-        # Space indices
-        space_idxs = []
-        for idx in ratio_idxs[:-1]:  # exclude last axes slot
-            offset = 1
-            while panels[idx + offset] not in 'rbf':  # main space next to this
-                offset += 1
-            space_idxs.append(idx + offset - 1)
-        idxs_space.append(space_idxs)
-    # Separate the panel and axes ratios
-    hratios_main = [hratios[idx] for idx in idxs_ratios[0]]
-    wratios_main = [wratios[idx] for idx in idxs_ratios[1]]
-    hratios_panels = [ratio for idx, ratio in enumerate(
-        hratios) if idx not in idxs_ratios[0]]
-    wratios_panels = [ratio for idx, ratio in enumerate(
-        wratios) if idx not in idxs_ratios[1]]
-    hspace_main = [hspace[idx] for idx in idxs_space[0]]
-    wspace_main = [wspace[idx] for idx in idxs_space[1]]
-    # Reduced geometry
-    nrows_main = len(hratios_main)
-    ncols_main = len(wratios_main)
-
-    # Get reference properties, account for panel slots in space and ratios
-    # TODO: Shouldn't panel space be included in these calculations?
-    (x1, x2), (y1, y2) = xref, yref
-    dx, dy = x2 - x1 + 1, y2 - y1 + 1
-    rwspace = sum(wspace_main[x1:x2])
-    rhspace = sum(hspace_main[y1:y2])
-    rwratio = (
-        ncols_main * sum(wratios_main[x1:x2 + 1])) / (dx * sum(wratios_main))
-    rhratio = (
-        nrows_main * sum(hratios_main[y1:y2 + 1])) / (dy * sum(hratios_main))
-    if rwratio == 0 or rhratio == 0:
-        raise RuntimeError(
-            f'Something went wrong, got wratio={rwratio!r} '
-            f'and hratio={rhratio!r} for reference axes.'
-        )
-    if np.iterable(aspect):
-        aspect = aspect[0] / aspect[1]
-
-    # Determine figure and axes dims from input in width or height dimenion.
-    # For e.g. common use case [[1,1,2,2],[0,3,3,0]], make sure we still scale
-    # the reference axes like square even though takes two columns of gridspec!
-    auto_width = (width is None and height is not None)
-    auto_height = (height is None and width is not None)
-    if width is None and height is None:  # get stuff directly from axes
-        if axwidth is None and axheight is None:
-            axwidth = units(rc['subplots.axwidth'])
-        if axheight is not None:
-            auto_width = True
+        # Separate the panel and axes ratios
+        hidxs_ratio, hidxs_panel, hidxs_space = self._idxs['h']
+        widxs_ratio, widxs_panel, widxs_space = self._idxs['w']
+        hratios_main = hratios[hidxs_ratio]
+        wratios_main = wratios[widxs_ratio]
+        hratios_panels = hratios[hidxs_panel].sum()
+        wratios_panels = wratios[widxs_panel].sum()
+        hspace_main = hspace[hidxs_space]
+        wspace_main = wspace[widxs_space]
+        hspace_all, wspace_all = hspace.sum(), wspace.sum()
+        # Reduced geometry
+        nrows_main = hratios_main.size
+        ncols_main = wratios_main.size
+
+        # Get reference properties, account for panel slots in space and ratios
+        # TODO: Shouldn't panel space be included in these calculations?
+        (x1, x2), (y1, y2) = xref, yref
+        dx, dy = x2 - x1 + 1, y2 - y1 + 1
+        rwspace = wspace_main[x1:x2].sum()
+        rhspace = hspace_main[y1:y2].sum()
+        rwratio = (
+            ncols_main * wratios_main[x1:x2 + 1].sum()
+        ) / (dx * wratios_main.sum())
+        rhratio = (
+            nrows_main * hratios_main[y1:y2 + 1].sum()
+        ) / (dy * hratios_main.sum())
+        if rwratio == 0 or rhratio == 0:
+            raise RuntimeError(
+                f'Something went wrong, got wratio={rwratio!r} '
+                f'and hratio={rhratio!r} for reference axes.'
+            )
+        if np.iterable(aspect):
+            aspect = aspect[0] / aspect[1]
+
+        # Determine figure and axes dims from input in width or height
+        # dimenion. For e.g. common use case [[1,1,2,2],[0,3,3,0]], make sure
+        # we still scale the reference axes like square even though takes two
+        # columns of gridspec!
+        auto_width = (width is None and height is not None)
+        auto_height = (height is None and width is not None)
+        if width is None and height is None:  # get stuff directly from axes
+            if axwidth is None and axheight is None:
+                axwidth = units(rc['subplots.axwidth'])
+            if axheight is not None:
+                auto_width = True
+                axheight_all = (
+                    nrows_main * (axheight - rhspace)) / (dy * rhratio)
+                height = axheight_all + top + bottom + \
+                    hspace_all + hratios_panels
+            if axwidth is not None:
+                auto_height = True
+                axwidth_all = (
+                    ncols_main * (axwidth - rwspace)) / (dx * rwratio)
+                width = axwidth_all + left + right + \
+                    wspace_all + wratios_panels
+            if axwidth is not None and axheight is not None:
+                auto_width = auto_height = False
+        else:
+            if height is not None:
+                axheight_all = height - top - bottom - \
+                    hspace_all - hratios_panels
+                axheight = (axheight_all * dy * rhratio) / nrows_main + rhspace
+            if width is not None:
+                axwidth_all = width - left - right - \
+                    wspace_all - wratios_panels
+                axwidth = (axwidth_all * dx * rwratio) / ncols_main + rwspace
+
+        # Automatically figure dim that was not specified above
+        if auto_height:
+            axheight = axwidth / aspect
             axheight_all = (nrows_main * (axheight - rhspace)) / (dy * rhratio)
-            height = axheight_all + top + bottom + \
-                sum(hspace) + sum(hratios_panels)
-        if axwidth is not None:
-            auto_height = True
+            height = axheight_all + top + bottom + hspace_all + hratios_panels
+        elif auto_width:
+            axwidth = axheight * aspect
             axwidth_all = (ncols_main * (axwidth - rwspace)) / (dx * rwratio)
-            width = axwidth_all + left + right + \
-                sum(wspace) + sum(wratios_panels)
-        if axwidth is not None and axheight is not None:
-            auto_width = auto_height = False
-    else:
-        if height is not None:
-            axheight_all = height - top - bottom - \
-                sum(hspace) - sum(hratios_panels)
-            axheight = (axheight_all * dy * rhratio) / nrows_main + rhspace
-        if width is not None:
-            axwidth_all = width - left - right - \
-                sum(wspace) - sum(wratios_panels)
-            axwidth = (axwidth_all * dx * rwratio) / ncols_main + rwspace
-
-    # Automatically figure dim that was not specified above
-    if auto_height:
-        axheight = axwidth / aspect
-        axheight_all = (nrows_main * (axheight - rhspace)) / (dy * rhratio)
-        height = axheight_all + top + bottom + \
-            sum(hspace) + sum(hratios_panels)
-    elif auto_width:
-        axwidth = axheight * aspect
-        axwidth_all = (ncols_main * (axwidth - rwspace)) / (dx * rwratio)
-        width = axwidth_all + left + right + sum(wspace) + sum(wratios_panels)
-    if axwidth_all < 0:
-        raise ValueError(
-            f'Not enough room for axes (would have width {axwidth_all}). '
-            'Try using tight=False, increasing figure width, or decreasing '
-            "'left', 'right', or 'wspace' spaces."
-        )
-    if axheight_all < 0:
-        raise ValueError(
-            f'Not enough room for axes (would have height {axheight_all}). '
-            'Try using tight=False, increasing figure height, or decreasing '
-            "'top', 'bottom', or 'hspace' spaces."
-        )
+            width = axwidth_all + left + right + wspace_all + wratios_panels
+        if axwidth_all < 0:
+            raise ValueError(
+                f'Not enough room for axes (would have width {axwidth_all}). '
+                'Try using tight=False, increasing figure width, or '
+                "decreasing 'left', 'right', or 'wspace' spaces."
+            )
+        if axheight_all < 0:
+            raise ValueError(
+                'Not enough room for axes (would have height '
+                f'{axheight_all}). Try using tight=False, increasing figure '
+                "height, or decreasing 'top', 'bottom', or 'hspace' spaces."
+            )
 
-    # Reconstruct the ratios array with physical units for subplot slots
-    # The panel slots are unchanged because panels have fixed widths
-    wratios_main = axwidth_all * np.array(wratios_main) / sum(wratios_main)
-    hratios_main = axheight_all * np.array(hratios_main) / sum(hratios_main)
-    for idx, ratio in zip(idxs_ratios[0], hratios_main):
-        hratios[idx] = ratio
-    for idx, ratio in zip(idxs_ratios[1], wratios_main):
-        wratios[idx] = ratio
-
-    # Convert margins to figure-relative coordinates
-    left = left / width
-    bottom = bottom / height
-    right = 1 - right / width
-    top = 1 - top / height
-
-    # Return gridspec keyword args
-    gridspec_kw = {
-        'ncols': ncols, 'nrows': nrows,
-        'wspace': wspace, 'hspace': hspace,
-        'width_ratios': wratios, 'height_ratios': hratios,
-        'left': left, 'bottom': bottom, 'right': right, 'top': top,
-    }
+        # Reconstruct the ratios array with physical units for subplot slots
+        # The panel slots are unchanged because panels have fixed widths
+        wratios[widxs_ratio] = axwidth_all * wratios_main / wratios_main.sum()
+        hratios[hidxs_ratio] = axheight_all * hratios_main / hratios_main.sum()
+
+        # Convert margins to figure-relative coordinates
+        left = left / width
+        bottom = bottom / height
+        right = 1 - right / width
+        top = 1 - top / height
 
-    return (width, height), gridspec_kw, kwargs
+        # Return gridspec keyword args
+        gridspec_kw = {
+            'ncols': ncols, 'nrows': nrows,
+            'wspace': wspace, 'hspace': hspace,
+            'width_ratios': wratios, 'height_ratios': hratios,
+            'left': left, 'bottom': bottom, 'right': right, 'top': top,
+        }
+
+        return (width, height), gridspec_kw
 
 
 class _hidelabels(object):
@@ -813,7 +984,11 @@ class Figure(mfigure.Figure):
     draw-time, an improved tight layout algorithm is employed, and
     the space around the figure edge, between subplots, and between
     panels is changed to accommodate subplot content. Figure dimensions
-    may be automatically scaled to preserve subplot aspect ratios."""
+    may be automatically scaled to preserve subplot aspect ratios.
+
+    Figures can also be used as context managers. On exit, the figure
+    is closed and its renderers and artists are released, for example
+    ``with fig: fig.save('figure.pdf')``."""
     def __init__(
         self, tight=None,
         ref=1, pad=None, axpad=None, panelpad=None, includepanels=False,
@@ -921,6 +1096,8 @@ class Figure(mfigure.Figure):
         self._authorized_add_subplot = False
         self._is_preprocessing = False
         self._is_resizing = False
+        self._is_bulk_adding = False
+        self._share_stale = False  # see _share_setup
         super().__init__(**kwargs)
 
         # Axes sharing and spanning settings
@@ -965,8 +1142,17 @@ class Figure(mfigure.Figure):
         self._larray = np.empty((0, nrows), dtype=bool)
         self._rarray = np.empty((0, nrows), dtype=bool)
         self._gridspec_main = gridspec
+        self._adjacency_index = None  # see _get_adjacency_index
+        self._layout_fingerprint = None  # see _get_layout_fingerprint
         self.suptitle('')  # add _suptitle attribute
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        plt.close(self)
+        self._release(clear=True)
+
     @_counter
     def _add_axes_panel(self, ax, side, filled=False, **kwargs):
         """Hidden method that powers `~proplot.axes.panel_axes`."""
@@ -1018,8 +1204,12 @@ class Figure(mfigure.Figure):
         pax._panel_parent = ax
 
         # Axis sharing and axis setup only for non-legend or colorbar axes
+        # NOTE: The panel shares its axis with the parent right away so that
+        # e.g. ax.set_ylim() called before drawing also applies to the panel.
+        # Sharing with other subplots is deferred. See _share_setup.
         if not filled:
-            ax._share_setup()
+            ax._share_panels_setup()
+            self._share_stale = True
             axis = (pax.yaxis if side in ('left', 'right') else pax.xaxis)
             # sets tick and tick label positions intelligently
             getattr(axis, 'tick_' + side)()
@@ -1156,7 +1346,7 @@ class Figure(mfigure.Figure):
 
         # Apply new aspect
         subplots_kw['aspect'] = aspect
-        figsize, gridspec_kw, _ = _subplots_geometry(**subplots_kw)
+        figsize, gridspec_kw = subplots_kw.solve()
         self.set_size_inches(figsize, auto=True)
         self._gridspec_main.update(**gridspec_kw)
 
@@ -1198,96 +1388,126 @@ class Figure(mfigure.Figure):
         # Get arrays storing gridspec spacing args
         axpad = self._axpad
         panelpad = self._panelpad
-        gridspec = self._gridspec_main
-        nrows, ncols = gridspec.get_active_geometry()
         wspace = subplots_kw['wspace']
         hspace = subplots_kw['hspace']
         wspace_orig = subplots_orig_kw['wspace']
         hspace_orig = subplots_orig_kw['hspace']
 
         # Get new subplot spacings, axes panel spacing, figure panel spacing
+        # NOTE: Layout is lspace, lspaces[0], rspaces[0], wspace, ...
+        # so panels spaces are located where i % 3 is 1 or 2
         spaces = []
-        for (w, x, y, nacross, ispace, ispace_orig) in zip(
-            'wh', 'xy', 'yx', (nrows, ncols),
-            (wspace, hspace), (wspace_orig, hspace_orig),
+        index = self._get_adjacency_index(axs)
+        for (w, x, ispace, ispace_orig) in zip(
+            'wh', 'xy', (wspace, hspace), (wspace_orig, hspace_orig),
         ):
-            # Determine which rows and columns correspond to panels
+            # Figure out whether each space is a normal space, or a
+            # panel stack space/axes panel space
             panels = subplots_kw[w + 'panels']
-            jspace = [*ispace]
-            ralong = np.array([ax._range_gridspec(x) for ax in axs])
-            racross = np.array([ax._range_gridspec(y) for ax in axs])
-            for i, (space, space_orig) in enumerate(zip(ispace, ispace_orig)):
-                # Figure out whether this is a normal space, or a
-                # panel stack space/axes panel space
-                pad = axpad
-                if (panels[i] in ('l', 't')
-                        and panels[i + 1] in ('l', 't', '')
-                        or panels[i] in ('', 'r', 'b')
-                        and panels[i + 1] in ('r', 'b')
-                        or panels[i] == 'f' and panels[i + 1] == 'f'):
-                    pad = panelpad
-                # Find axes that abutt aginst this space on each row
-                groups = []
-                # i.e. right/bottom edge abutts against this space
-                filt1 = ralong[:, 1] == i
-                # i.e. left/top edge abutts against this space
-                filt2 = ralong[:, 0] == i + 1
-                for j in range(nacross):  # e.g. each row
-                    # Get indices
-                    filt = (racross[:, 0] <= j) & (j <= racross[:, 1])
-                    if sum(filt) < 2:  # no interface here
-                        continue
-                    idx1, = np.where(filt & filt1)
-                    idx2, = np.where(filt & filt2)
-                    if idx1.size > 1 or idx2.size > 2:
-                        _warn_proplot('This should never happen.')
-                        continue
-                    elif not idx1.size or not idx2.size:
-                        continue
-                    idx1, idx2 = idx1[0], idx2[0]
-                    # Put these axes into unique groups. Store groups as
-                    # (left axes, right axes) or (bottom axes, top axes) pairs.
-                    ax1, ax2 = axs[idx1], axs[idx2]
-                    if x != 'x':  # order bottom-to-top
-                        ax1, ax2 = ax2, ax1
-                    newgroup = True
-                    for (group1, group2) in groups:
-                        if ax1 in group1 or ax2 in group2:
-                            newgroup = False
-                            group1.add(ax1)
-                            group2.add(ax2)
-                            break
-                    if newgroup:
-                        groups.append([{ax1}, {ax2}])  # form new group
-                # Get spaces
-                # Layout is lspace, lspaces[0], rspaces[0], wspace, ...
-                # so panels spaces are located where i % 3 is 1 or 2
-                jspaces = []
-                for (group1, group2) in groups:
-                    x1 = max(ax._range_tightbbox(x)[1] for ax in group1)
-                    x2 = min(ax._range_tightbbox(x)[0] for ax in group2)
-                    jspaces.append((x2 - x1) / self.dpi)
-                if jspaces:
-                    space = max(0, space - min(jspaces) + pad)
-                    space = _notNone(space_orig, space)  # user input overwrite
-                jspace[i] = space
+            panels1, panels2 = panels[:-1], panels[1:]
+            pad = np.where(
+                np.isin(panels1, ('l', 't'))
+                & np.isin(panels2, ('l', 't', ''))
+                | np.isin(panels1, ('', 'r', 'b'))
+                & np.isin(panels2, ('r', 'b'))
+                | (panels1 == 'f') & (panels2 == 'f'),
+                panelpad, axpad
+            )
+            # Get the minimum distance between the tight bounding boxes of
+            # each group of abutting axes, then the minimum for each space
+            jspace = np.array(ispace)
+            idx1, off1, idx2, off2, idx_space = index[x]
+            if idx_space.size:
+                extents = np.array([ax._range_tightbbox(x) for ax in axs])
+                x1 = np.fmax.reduceat(extents[idx1, 1], off1)
+                x2 = np.fmin.reduceat(extents[idx2, 0], off2)
+                jspaces = np.full(jspace.size, np.nan)
+                np.fmin.at(jspaces, idx_space, (x2 - x1) / self.dpi)
+                mask = ~np.isnan(jspaces)
+                jspace[mask] = np.maximum(
+                    0, jspace[mask] - jspaces[mask] + pad[mask]
+                )
+                for i in np.where(mask)[0]:  # user input overwrite
+                    jspace[i] = _notNone(ispace_orig[i], jspace[i])
             spaces.append(jspace)
 
         # Update geometry solver kwargs
         subplots_kw.update({
             'wspace': spaces[0], 'hspace': spaces[1],
         })
+        figsize = None
         if not resize:
-            width, height = self.get_size_inches()
-            subplots_kw = subplots_kw.copy()
-            subplots_kw.update(width=width, height=height)
+            figsize = self.get_size_inches()
 
         # Apply new spacing
-        figsize, gridspec_kw, _ = _subplots_geometry(**subplots_kw)
+        figsize, gridspec_kw = subplots_kw.solve(figsize)
         if resize:
             self.set_size_inches(figsize, auto=True)
         self._gridspec_main.update(**gridspec_kw)
 
+    def _get_adjacency_index(self, axs):
+        """Return the groups of axes that abutt against each space in the main
+        gridspec, used for tight layout adjustments. The result is cached
+        until the gridspec or the axes change."""
+        key = (self._gridspec_main, *axs)
+        if self._adjacency_index is not None:
+            ikey, index = self._adjacency_index
+            if len(ikey) == len(key) and all(
+                a is b for a, b in zip(ikey, key)
+            ):
+                return index
+
+        # For each space, find the axes on either side in each row or column
+        # then put these axes into groups. Groups are stored as (left axes,
+        # right axes) or (bottom axes, top axes) pairs and are flattened into
+        # index arrays for use with ufunc.reduceat.
+        index = {}
+        for x, y in ('xy', 'yx'):
+            ralong = [ax._range_gridspec(x) for ax in axs]
+            racross = [ax._range_gridspec(y) for ax in axs]
+            edges1, edges2 = {}, {}  # axes whose right/left edge abutt space
+            for k, (r1, r2) in enumerate(ralong):
+                edges1.setdefault(r2, []).append(k)
+                edges2.setdefault(r1 - 1, []).append(k)
+            idx1, off1, idx2, off2, idx_space = [], [], [], [], []
+            for i in sorted(edges1.keys() & edges2.keys()):
+                rows1, rows2 = {}, {}
+                for rows, ks in ((rows1, edges1[i]), (rows2, edges2[i])):
+                    for k in ks:
+                        for j in range(racross[k][0], racross[k][1] + 1):
+                            rows.setdefault(j, []).append(k)
+                groups = []
+                first1, first2 = {}, {}  # first group containing each axes
+                for j in sorted(rows1.keys() & rows2.keys()):
+                    if len(rows1[j]) > 1 or len(rows2[j]) > 2:
+                        _warn_proplot('This should never happen.')
+                        continue
+                    k1, k2 = rows1[j][0], rows2[j][0]
+                    if x != 'x':  # order bottom-to-top
+                        k1, k2 = k2, k1
+                    n = min(
+                        first1.get(k1, len(groups)),
+                        first2.get(k2, len(groups))
+                    )
+                    if n == len(groups):
+                        groups.append(({k1}, {k2}))  # form new group
+                    groups[n][0].add(k1)
+                    groups[n][1].add(k2)
+                    first1[k1] = min(first1.get(k1, n), n)
+                    first2[k2] = min(first2.get(k2, n), n)
+                for group1, group2 in groups:
+                    off1.append(len(idx1))
+                    off2.append(len(idx2))
+                    idx1.extend(sorted(group1))
+                    idx2.extend(sorted(group2))
+                    idx_space.append(i)
+            index[x] = tuple(
+                np.array(_, dtype=int)
+                for _ in (idx1, off1, idx2, off2, idx_space)
+            )
+        self._adjacency_index = (key, index)
+        return index
+
     def _align_axislabels(self, b=True):
         """Align spanning *x* and *y* axis labels in the perpendicular
         direction and, if `b` is ``True``, the parallel direction."""
@@ -1367,10 +1587,15 @@ class Figure(mfigure.Figure):
             x = ('x' if s in 'lr' else 'y')
             axs = self._get_align_axes(s)
             axs = [ax._reassign_suplabel(s) for ax in axs]
-            labels = [getattr(ax, '_' + s + 'label') for ax in axs]
-            coords = [None] * len(axs)
             if s == 't' and suptitle_on:
                 supaxs = axs
+            labels = [getattr(ax, '_' + s + 'label') for ax in axs]
+            if not any(label and label.get_text().strip() for label in labels):
+                continue  # skip sides without labels
+            axs, labels = zip(*(
+                (ax, label) for ax, label in zip(axs, labels) if label
+            ))
+            coords = [None] * len(axs)
             with _hidelabels(*labels):
                 for i, (ax, label) in enumerate(zip(axs, labels)):
                     label_on = label.get_text().strip()
@@ -1436,6 +1661,21 @@ class Figure(mfigure.Figure):
         internally."""
         return _setstate(self, _authorized_add_subplot=True)
 
+    def _context_bulk_adding(self):
+        """Add many subplots at once. Figure-wide settings are not
+        re-applied by every new axes. Used internally."""
+        return _setstate(
+            self, _authorized_add_subplot=True, _is_bulk_adding=True
+        )
+
+    def _context_fallback_to_cm(self):
+        """Apply the figure-level :rc:`mathtext.fallback_to_cm` setting while
+        drawing or saving the figure."""
+        fallback = _notNone(
+            self._fallback_to_cm, rc['mathtext.fallback_to_cm']
+        )
+        return rc.context({'mathtext.fallback_to_cm': fallback})
+
     def _context_resizing(self):
         """Ensure backend calls to `~matplotlib.figure.Figure.set_size_inches`
         during pre-processing are not interpreted as *manual* resizing."""
@@ -1494,6 +1734,48 @@ class Figure(mfigure.Figure):
         ranges = [ax._range_gridspec(y)[0] for ax in axs]
         return [ax for _, ax in sorted(zip(ranges, axs)) if ax.get_visible()]
 
+    def _get_layout_fingerprint(self, resize=True):
+        """Return a cheap summary of the state used by the pre-processing
+        steps in `_canvas_preprocess`: the figure size and dpi, the gridspec
+        and panel geometry, text contents and fonts, legend positions, and
+        the properties that determine tick label extents, including locator
+        and formatter settings changed in-place. Compared with ``==``, never
+        hashed."""
+        axs = [*self.axes]
+        for ax in axs:  # also get inset axes
+            axs.extend(ax.child_axes)
+        items = []
+        for ax in axs:
+            items.append((
+                ax, ax.get_visible(), ax.axison, ax.get_aspect(),
+                bool(getattr(ax, '_auto_legend', None)
+                     or getattr(ax, '_auto_colorbar', None)),
+            ))
+            for obj in ax.get_children():
+                if isinstance(obj, mtext.Text):
+                    items.append(_text_fingerprint(obj))
+                elif isinstance(obj, maxis.Axis):
+                    items.append(_axis_fingerprint(obj))
+                elif isinstance(obj, mlegend.Legend):
+                    items.append(_legend_fingerprint(obj))
+        items.extend(map(_legend_fingerprint, self.legends))
+        items.extend(map(_text_fingerprint, (self._suptitle, *self.texts)))
+        gridspec = self._gridspec_main
+        subplots_kw = self._subplots_kw
+        return (
+            resize, self.dpi, tuple(self.get_size_inches()),
+            self._auto_tight, self._alignx, self._aligny,
+            self._spanx, self._spany, self._include_panels,
+            self._pad, self._axpad, self._panelpad, self._ref_num,
+            gridspec, gridspec.get_margins(),
+            gridspec.get_width_ratios(), gridspec.get_height_ratios(),
+            [
+                (key, value.tolist() if isinstance(value, np.ndarray)
+                 else value) for key, value in subplots_kw.items()
+            ],
+            items,
+        )
+
     def _get_renderer(self):
         """Get a renderer at all costs, even if it means generating a brand
         new one! Used for updating the figure bounding box when it is accessed
@@ -1528,16 +1810,12 @@ class Figure(mfigure.Figure):
             raise ValueError(f'Invalid side {side}.')
         idx_space = idx - 1 * bool(s in 'br')
         idx_offset = 1 * bool(s in 'tl')
-        if s in 'lr':
-            w, ncols = 'w', 'ncols'
-        else:
-            w, ncols = 'h', 'nrows'
+        w = ('w' if s in 'lr' else 'h')
 
         # Load arrays and test if we need to insert
         subplots_kw = self._subplots_kw
         subplots_orig_kw = self._subplots_orig_kw
         panels = subplots_kw[w + 'panels']
-        ratios = subplots_kw[w + 'ratios']
         spaces = subplots_kw[w + 'space']
         spaces_orig = subplots_orig_kw[w + 'space']
 
@@ -1550,15 +1828,11 @@ class Figure(mfigure.Figure):
             spaces[idx_space] = _notNone(spaces_orig[idx_space], space)
         # Make room for new panel slot
         else:
-            # Modify basic geometry
+            # Modify basic geometry, ratio array, space array, panel toggles
             idx += idx_offset
             idx_space += idx_offset
-            subplots_kw[ncols] += 1
-            # Original space, ratio array, space array, panel toggles
+            subplots_kw.insert(w, idx, idx_space, ratio, space, entry)
             spaces_orig.insert(idx_space, space_orig)
-            spaces.insert(idx_space, space)
-            ratios.insert(idx, ratio)
-            panels.insert(idx, entry)
             # Reference ax location array
             # TODO: For now do not need to increment, but need to double
             # check algorithm for fixing axes aspect!
@@ -1566,7 +1840,7 @@ class Figure(mfigure.Figure):
             # ref[:] = [val + 1 if val >= idx else val for val in ref]
 
         # Update figure
-        figsize, gridspec_kw, _ = _subplots_geometry(**subplots_kw)
+        figsize, gridspec_kw = subplots_kw.solve()
         self.set_size_inches(figsize, auto=True)
         if exists:
             gridspec = self._gridspec_main
@@ -1614,6 +1888,54 @@ class Figure(mfigure.Figure):
 
         return gridspec
 
+    def _release(self, clear=False):
+        """Release the cached renderers and layout caches. If `clear` is
+        ``True``, the figure contents are removed as well. Used when closing
+        managed figures."""
+        self._cachedRenderer = None
+        self._adjacency_index = None
+        self._layout_fingerprint = None
+        canvas = self.canvas
+        if getattr(canvas, 'renderer', None) is not None:  # e.g. agg canvas
+            canvas.renderer = None
+            canvas._lastKey = None
+        for ax in self._iter_axes():
+            ax._tightbbox = None
+        if clear:
+            self.clf()
+            self._axes_main = []
+            self._lpanels = []
+            self._rpanels = []
+            self._bpanels = []
+            self._tpanels = []
+
+    def _share_setup(self):
+        """Configure axis sharing for every main axes and panel in a single
+        pass. Adding main axes or panels flags the sharing as stale, and it
+        is resolved here by `subplots`, by `~proplot.axes.Axes.format`, and
+        before drawing. Panels are also shared with their parent axes as soon
+        as they are added. The axes are grouped by their extent in the main
+        gridspec once instead of searching the subplot grid for every axes."""
+        if not self._share_stale:
+            return
+        self._share_stale = False
+        axs = self._axes_main
+        for ax in axs:
+            ax._share_panels_setup()
+        for x, y, idx, argfunc in (
+            ('x', 'y', 0, np.argmax), ('y', 'x', 1, np.argmin)
+        ):
+            groups = {}
+            for ax in axs:
+                groups.setdefault(ax._range_gridspec(x), []).append(ax)
+            for iaxs in groups.values():
+                # The leftmost or bottommost axes is the parent
+                parent = iaxs.pop(argfunc(
+                    [ax._range_gridspec(y)[idx] for ax in iaxs]
+                ))
+                for child in iaxs:
+                    getattr(child, '_share' + x + '_setup')(parent)
+
     def _update_figtitle(self, title, **kwargs):
         """Assign the figure "super title" and update settings."""
         if title is not None and self._suptitle.get_text() != title:
@@ -1621,6 +1943,29 @@ class Figure(mfigure.Figure):
         if kwargs:
             self._suptitle.update(kwargs)
 
+    def _update_layout(self):
+        """Draw queued legends and colorbars, then apply the aspect ratio
+        and tight layout adjustments and align labels. Skipped if nothing has
+        changed since the last time, e.g. when saving one figure to several
+        formats. See `_get_layout_fingerprint`. Also marks the figure as the
+        most recently used figure for :rcraw:`subplots.maxfigs`."""
+        if id(self) in _managed_figures:  # drawn, shown, or saved
+            _managed_figures.move_to_end(id(self))
+        self._share_setup()  # may hide axis and tick labels
+        resize = rc['backend'] != 'nbAgg'
+        if self._get_layout_fingerprint(resize) == self._layout_fingerprint:
+            return
+        renderer = self._get_renderer()  # any renderer will do
+        for ax in self._iter_axes():
+            ax._draw_auto_legends_colorbars()  # may insert panels
+        if resize:
+            self._adjust_aspect()  # resizes figure
+        if self._auto_tight:
+            self._adjust_tight_layout(renderer, resize=resize)
+        self._align_axislabels(True)
+        self._align_labels(renderer)
+        self._layout_fingerprint = self._get_layout_fingerprint(resize)
+
     def _update_labels(self, ax, side, labels, **kwargs):
         """Assign the side labels and update settings."""
         s = side[0]
@@ -1641,7 +1986,12 @@ class Figure(mfigure.Figure):
                 'along that side.'
             )
         for ax, label in zip(axs, labels):
+            # Labels are only created when they are assigned text
             obj = getattr(ax, '_' + s + 'label')
+            if obj is None and label is None:
+                ax._suplabel_kw.setdefault(s, {}).update(kwargs)
+                continue
+            obj = ax._get_suplabel(s)
             if label is not None and obj.get_text() != label:
                 obj.set_text(label)
             if kwargs:
@@ -1825,7 +2175,55 @@ class Figure(mfigure.Figure):
     def savefig(self, filename, **kwargs):
         # Automatically expand user the user name. Undocumented because we
         # do not want to overwrite the matplotlib docstring.
-        super().savefig(os.path.expanduser(filename), **kwargs)
+        if isinstance(filename, (str, os.PathLike)):
+            filename = os.path.expanduser(filename)
+        super().savefig(filename, **kwargs)
+
+    def save_many(self, targets, **kwargs):
+        """
+        Save the figure to several files at once. The figure layout is
+        computed once, then the figure is rendered to each file without the
+        extra draw that precedes every `~Figure.savefig` call.
+
+        Parameters
+        ----------
+        targets : list of str, path-like, file-like, or (target, dict)
+            The file names, paths, or file objects. The format is inferred
+            from the extension. Use ``(target, kw)`` tuples to pass keyword
+            arguments to individual saves, e.g.
+            ``[('fig.png', {'dpi': 150}), 'fig.pdf']``. File objects
+            without a name require the ``format`` keyword argument.
+        **kwargs
+            Passed to `~matplotlib.figure.Figure.savefig` for every file.
+            Overridden by the per-file keyword arguments.
+
+        Note
+        ----
+        Files are written one after another. Matplotlib changes the figure
+        state (e.g. the dpi) while printing, so the same figure cannot be
+        rendered from several threads at once.
+        """
+        items = []
+        for target in targets:
+            if isinstance(target, (str, os.PathLike)) or hasattr(
+                target, 'write'
+            ):
+                filename, kw = target, {}
+            else:
+                filename, kw = target
+            items.append((filename, {**kwargs, **kw}))
+        # Temporarily restore the unpatched print_figure() to skip the
+        # forced draw and pre-processing. See `_canvas_preprocess`.
+        # NOTE: print_figure() ends with set_canvas(), which reapplies the
+        # patch, so the method is restored again before every file.
+        with self._context_preprocessing():
+            self._update_layout()
+            with self._context_fallback_to_cm():
+                for filename, kw in items:
+                    canvas = self.canvas
+                    print_figure = type(canvas).print_figure.__get__(canvas)
+                    with _setstate(canvas, print_figure=print_figure):
+                        self.savefig(filename, **kw)
 
     def set_canvas(self, canvas):
         # Set the canvas and add monkey patches to the instance-level
@@ -2361,7 +2759,7 @@ def subplots(
     wspace, hspace = list(wspace), list(hspace)
 
     # Parse arguments, fix dimensions in light of desired aspect ratio
-    figsize, gridspec_kw, subplots_kw = _subplots_geometry(
+    subplots_kw = _SubplotsGeometry(
         nrows=nrows, ncols=ncols,
         aspect=aspect, xref=xref, yref=yref,
         left=left, right=right, bottom=bottom, top=top,
@@ -2369,6 +2767,7 @@ def subplots(
         wratios=wratios, hratios=hratios, wspace=wspace, hspace=hspace,
         wpanels=[''] * ncols, hpanels=[''] * nrows,
     )
+    figsize, gridspec_kw = subplots_kw.solve()
     fig = plt.figure(
         FigureClass=Figure, figsize=figsize, ref=ref,
         gridspec_kw=gridspec_kw, subplots_kw=subplots_kw,
@@ -2386,18 +2785,106 @@ def subplots(
         y0, y1 = yrange[idx, 0], yrange[idx, 1]
         # Draw subplot
         subplotspec = gridspec[y0:y1 + 1, x0:x1 + 1]
-        with fig._authorize_add_subplot():
+        with fig._context_bulk_adding():
             axs[idx] = fig.add_subplot(
                 subplotspec, number=num, main=True,
                 **axes_kw[num]
             )
 
     # Shared axes setup
-    # TODO: Figure out how to defer this to drawtime in #50
-    # For some reason just adding _share_setup() to draw() doesn't work
-    for ax in axs:
-        ax._share_setup()
+    # NOTE: This cannot wait until draw-time because axis limits set
+    # before the first draw must propagate to the shared axes.
+    fig._share_setup()
+    _manage_figure(fig)
 
     # Return figure and axes
     n = (ncols if order == 'C' else nrows)
     return fig, subplot_grid(axs, n=n, order=order)
+
+
+def _render_batch_init(settings, cmaps, benchmark):
+    """Initialize a `render_batch` worker process with the settings and
+    colormaps from the parent process."""
+    plt.switch_backend('agg')
+    _set_settings(settings)
+    for name, cmap in cmaps.items():  # also updates the colormap lists
+        mcm.cmap_d[name] = cmap
+    utils.BENCHMARK = benchmark
+
+
+def _render_batch_item(i, func, item, targets, kwargs, initargs=None):
+    """Build and save one `render_batch` figure, then close every figure
+    opened in the process. If `initargs` is passed, the process is
+    initialized first."""
+    if initargs is not None:
+        _render_batch_init(*initargs)
+    nums = set(plt.get_fignums())
+    try:
+        with _benchmark(f'render_batch item {i}'):
+            fig = func(item)
+            if targets is not None:
+                if isinstance(targets, str):
+                    targets = [targets]
+                fig.save_many(targets, **kwargs)
+    finally:
+        for num in set(plt.get_fignums()) - nums:
+            plt.close(num)
+
+
+def render_batch(func, items, filenames=None, max_workers=None, **kwargs):
+    """
+    Build and save many independent figures in parallel using a process pool.
+    Each worker process is initialized once with the current settings and
+    registered colormaps, and every figure is closed as soon as it is saved.
+
+    Parameters
+    ----------
+    func : callable
+        Called with each item. Should return a `Figure`. Must be picklable,
+        e.g. a function defined at the top level of a module.
+    items : list
+        The items.
+    filenames : list, optional
+        The output files for each item, passed to `Figure.save_many`. Each
+        entry can be a file name or a list of targets. If ``None``, `func`
+        is responsible for saving the figures.
+    max_workers : int, optional
+        The number of worker processes. Default is the number of CPUs. If
+        ``1``, figures are rendered sequentially in the current process.
+    **kwargs
+        Passed to `Figure.save_many`. Not allowed if `filenames` is ``None``.
+
+    Note
+    ----
+    Worker processes use the non-interactive ``'agg'`` backend. Timings for
+    each figure are printed when benchmarking is enabled.
+    """
+    items = list(items)
+    if filenames is None and kwargs:
+        raise ValueError(
+            'Keyword arguments for save_many() were passed without '
+            'filenames: ' + ', '.join(map(repr, kwargs)) + '.'
+        )
+    if filenames is None:
+        filenames = [None] * len(items)
+    elif len(filenames) != len(items):
+        raise ValueError(
+            f'Got {len(items)} items but {len(filenames)} filenames.'
+        )
+    args = (range(len(items)), [func] * len(items), items, filenames)
+    args += ([kwargs] * len(items),)
+    if max_workers == 1:
+        list(map(_render_batch_item, *args))
+        return
+    # NOTE: The executor initializer requires python 3.7. On python 3.6 the
+    # settings are sent with every item instead.
+    initargs = (_get_settings(), dict(mcm.cmap_d), utils.BENCHMARK)
+    if sys.version_info >= (3, 7):
+        kw = {'initializer': _render_batch_init, 'initargs': initargs}
+    else:
+        kw = {}
+        args += ([initargs] * len(items),)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, **kw
+    ) as executor:
+        list(executor.map(_render_batch_item, *args))  # raises worker errors
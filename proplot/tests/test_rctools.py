@@ -0,0 +1,270 @@
+import os
+import re
+import subprocess
+import sys
+import threading
+
+import matplotlib.pyplot as plt
+import pytest
+
+import proplot as plot
+from proplot import rctools
+
+
+def test_write_defaults(tmp_path):
+    """Tests that the default settings can be written and read back."""
+    filename = str(tmp_path / '.proplotrc')
+    rctools._write_defaults(filename, comment=False)
+    kw = rctools._parse_file(filename)
+    assert kw['subplots.maxfigs'] == 0
+
+
+def test_import_empty_home(tmp_path):
+    """Tests that proplot can be imported without a ``.proplotrc`` file."""
+    env = os.environ.copy()
+    env['HOME'] = str(tmp_path)
+    subprocess.run(
+        [sys.executable, '-c', 'import proplot'], env=env, check=True,
+    )
+    assert (tmp_path / '.proplotrc').exists()
+
+
+def test_context_setitem():
+    """Tests that settings changed inside a context block are returned."""
+    linewidth = plot.rc['linewidth']
+    with plot.rc.context(linewidth=2):
+        assert plot.rc['linewidth'] == 2.0
+        plot.rc['linewidth'] = 3
+        assert plot.rc['linewidth'] == 3.0
+        plot.rc.update(linewidth=4)
+        assert plot.rc['linewidth'] == 4.0
+        with plot.rc.context(linewidth=5):
+            plot.rc['linewidth'] = 6
+            assert plot.rc['linewidth'] == 6.0
+        assert plot.rc['linewidth'] == 4.0
+        assert plt.rcParams['xtick.major.width'] == 4.0
+    assert plot.rc['linewidth'] == linewidth
+
+
+def test_context_threads():
+    """Tests that context blocks in other threads are not visible."""
+    entered = threading.Event()
+    done = threading.Event()
+    values = []
+
+    def _worker():
+        with plot.rc.context(linewidth=5):
+            entered.set()
+            done.wait(5)
+            values.append(plot.rc['linewidth'])
+
+    with plot.rc.context(linewidth=2):
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        entered.wait(5)
+        values.append(plot.rc['linewidth'])
+        done.set()
+        thread.join()
+    assert values == [2.0, 5.0]
+
+
+def test_update_from_file(tmp_path):
+    """Tests that files are applied in full or not at all."""
+    filename = tmp_path / '.proplotrc'
+    small = plot.rc['small']
+    filename.write_text(
+        'share: True\n'
+        'span: 0\n'
+        'linewidth: thick\n'
+        'axes.facecolor: notacolor\n'
+        'small: 7\n'
+    )
+    try:
+        with pytest.warns(UserWarning) as record:
+            rctools._update_from_file(str(filename))
+        assert len(record) == 1
+        message = str(record[0].message)
+        assert 'linewidth' in message and 'axes.facecolor' in message
+        assert plot.rc['small'] == small
+        filename.write_text('share: True\nspan: 0\nsmall: 7\n')
+        rctools._update_from_file(str(filename))
+        assert plot.rc['share'] is True
+        assert plot.rc['span'] == 0
+        assert plot.rc['small'] == 7
+    finally:
+        plot.rc.reset()
+
+
+@pytest.mark.parametrize('cat', ['axes', 'xtick.major', 'title', 'subplots'])
+def test_category(cat):
+    """Tests that categories contain the settings directly inside them."""
+    keys = [
+        key for rcdict in (rctools.rcParamsLong, rctools.rcParams)
+        for key in rcdict if re.match(fr'\A{cat}\.[^.]+\Z', key)
+        and rcdict[key] is not None  # omitted by category()
+    ]
+    kw = plot.rc.category(cat)
+    assert sorted(kw) == sorted(key[len(cat) + 1:] for key in keys)
+    kw = plot.rc.category(cat, trimcat=False)
+    assert kw == {key: plot.rc[key] for key in keys}
+    with plot.rc.context({keys[0]: plot.rc[keys[0]]}, mode=2):
+        kw = plot.rc.category(cat, trimcat=False, context=True)
+    assert list(kw) == [keys[0]]
+
+
+def test_context_get_item():
+    """Tests the lookup precedence and modes of nested context blocks."""
+    rc = plot.rc
+    with rc.context(linewidth=2, mode=2):
+        assert rc._get_item('linewidth') == 2
+        assert rc._get_item('title.loc') is None
+        assert rc._get_item('axes.facecolor') is None
+        with rc.context(linewidth=3, mode=1):
+            assert rc._get_item('linewidth') == 3
+            assert rc._get_item('title.loc') == rc['title.loc']
+            assert rc._get_item('axes.facecolor') is None
+        assert rc._get_item('linewidth') == 2
+        assert rc._get_item('title.loc') is None
+    assert rc._get_item('axes.facecolor') == rc['axes.facecolor']
+
+
+def test_synced_params():
+    """Tests that synced settings use the current dependency values."""
+    rc = plot.rc
+    with rc.context(ticklen=4, ticklenratio=0.5):
+        assert rc['xtick.major.size'] == 4
+        assert rc['xtick.minor.size'] == 2
+        rc['ticklenratio'] = 0.25
+        assert rc['ytick.minor.size'] == 1
+        rc['ticklen'] = 4  # memoized result must use the new ratio
+        assert rc['xtick.minor.size'] == 1
+    with rc.context(linewidth=2, tickratio=0.5):
+        assert rc['xtick.minor.width'] == 1
+    with rc.context({'font.size': 10}, ticklen=4):
+        rc['ticklen'] = '1em'
+        assert rc['xtick.major.size'] == pytest.approx(10)
+        rc['font.size'] = 20
+        rc['ticklen'] = '1em'
+        assert rc['xtick.major.size'] == pytest.approx(20)
+
+
+def test_reset_cache(tmp_path, monkeypatch):
+    """Tests that cached settings are restored and refreshed on reset."""
+    rc = plot.rc
+    rc.reset()
+    settings = rctools._get_settings()
+    rc.update(small=5, linewidth=3)
+    rc.reset()
+    assert rctools._get_settings() == settings
+    rctools._rc_init_cache.clear()
+    rc.reset()
+    assert rctools._get_settings() == settings
+    monkeypatch.chdir(tmp_path)
+    filename = tmp_path / '.proplotrc'
+    try:
+        filename.write_text('small: 5\n')
+        rc.reset()
+        assert rc['small'] == 5
+        filename.write_text('small: 11\n')
+        rc.reset()
+        assert rc['small'] == 11
+    finally:
+        monkeypatch.undo()
+        rc.reset()
+    assert rctools._get_settings() == settings
+
+
+def test_update_batch():
+    """Tests that rc.update applies all settings or none of them."""
+    rc = plot.rc
+    kw = {key: rc[key] for key in ('axes.labelsize', 'axes.titlesize')}
+    with rc.context(kw, linewidth=1, small=8):
+        with pytest.raises((KeyError, ValueError)):
+            rc.update(linewidth=2, small=9, notasetting=1)
+        assert rc['linewidth'] == 1 and rc['small'] == 8
+        changes = rc.update(linewidth=2, small=8, dryrun=True)
+        assert changes['linewidth'] == (1, 2)
+        assert 'small' not in changes
+        assert 'xtick.minor.width' in changes  # synced setting
+        assert rc['linewidth'] == 1
+        rc.update('axes', labelsize=12, titlesize=13)
+        assert rc['axes.labelsize'] == 12 and rc['axes.titlesize'] == 13
+
+
+def test_register_style():
+    """Tests that registered styles are applied and restored."""
+    rc = plot.rc
+    rc.register_style('test', {'axes.facecolor': 'gray'}, linewidth=3)
+    linewidth, facecolor = rc['linewidth'], rc['axes.facecolor']
+    with rc.context(style='test', small=7):
+        assert rc['linewidth'] == 3
+        assert rc['axes.facecolor'] == 'gray'
+        assert rc['xtick.major.width'] == 3  # synced setting
+        assert rc['small'] == 7
+    assert rc['linewidth'] == linewidth
+    assert rc['axes.facecolor'] == facecolor
+    with pytest.raises(ValueError):
+        with rc.context(style='notastyle'):
+            pass
+
+
+def test_context_restore():
+    """Tests that nested and overlapping context blocks restore settings."""
+    rc = plot.rc
+    settings = rctools._get_settings()
+    with rc.context(ticklen=7):
+        with rc.context(linewidth=2, ticklen=8):
+            assert rc['xtick.major.size'] == 8
+        assert rc['xtick.major.size'] == 7
+        assert rc['xtick.minor.size'] == 7 * rc['ticklenratio']
+    assert rctools._get_settings() == settings
+
+    # Blocks entered by two threads that exit in the order they were entered
+    linewidth = rc['linewidth']
+    entered, exited = threading.Event(), threading.Event()
+
+    def _worker():
+        with rc.context(linewidth=3):
+            entered.set()
+            exited.wait(5)
+
+    thread = threading.Thread(target=_worker)
+    with rc.context(linewidth=2):
+        thread.start()
+        entered.wait(5)
+        assert rc['linewidth'] == 2
+    assert rc['linewidth'] == linewidth
+    exited.set()
+    thread.join()
+    assert rc['linewidth'] == linewidth
+    assert rctools._get_settings() == settings
+
+
+def test_context_threads_render():
+    """Tests that matplotlib reads the settings of the current thread."""
+    entered = threading.Event()
+    done = threading.Event()
+    widths = []
+
+    def _worker():
+        with plot.rc.context({'lines.linewidth': 5}):
+            entered.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=_worker)
+    try:
+        with plot.rc.context({'lines.linewidth': 2}):
+            thread.start()
+            entered.wait(5)
+            fig, ax = plt.subplots()
+            widths.append(ax.plot([0, 1])[0].get_linewidth())
+            widths.append(plt.rcParams['lines.linewidth'])
+        fig2, ax2 = plt.subplots()
+        widths.append(ax2.plot([0, 1])[0].get_linewidth())
+    finally:
+        done.set()
+        thread.join()
+    assert widths == [2.0, 2.0, plot.rc['lines.linewidth']]
+    assert plt.rcParams.copy()['lines.linewidth'] == widths[2]
+    plt.close(fig)
+    plt.close(fig2)
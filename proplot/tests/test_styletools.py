@@ -0,0 +1,124 @@
+import matplotlib.cm as mcm
+import matplotlib.colors as mcolors
+import numpy as np
+import pytest
+
+import proplot as plot
+from proplot import styletools
+
+
+def test_derived_cmap_copies():
+    """Tests that reversed and shifted colormaps are new objects."""
+    for name in ('RdBu_r', 'twilight_shifted', 'BuRd'):
+        cmap1 = mcm.cmap_d[name]
+        cmap1.set_under('lime')
+        cmap1.set_alpha(0.5)
+        cmap2 = mcm.cmap_d[name]
+        assert cmap2 is not cmap1
+        assert not np.allclose(cmap2(-1.0), cmap1(-1.0))
+        assert cmap2(0.5)[3] == 1
+
+
+def test_derived_cmap_shared_lut():
+    """Tests that reversed colormap lookups share one lookup table until
+    the lookup table of a copy is modified."""
+    cmap1 = mcm.cmap_d['RdBu_r']
+    cmap2 = mcm.cmap_d['RdBu_r']
+    assert cmap1._isinit and cmap1._lut is cmap2._lut
+    under = cmap2(-1.0)
+    cmap1.set_under('lime')
+    cmap1.set_over('lime')
+    cmap1.set_bad('lime')
+    assert cmap1._lut is not cmap2._lut
+    assert np.allclose(cmap1(-1.0), mcolors.to_rgba('lime'))
+    assert np.allclose(cmap2(-1.0), under)
+    assert np.allclose(mcm.cmap_d['RdBu_r'](-1.0), under)
+
+
+def test_derived_cmap_lut():
+    """Tests that reversed colormaps match the parent lookup table."""
+    cmap = mcm.cmap_d['viridis']
+    cmap_r = mcm.cmap_d['viridis_r']
+    cmap._init()
+    cmap_r._init()
+    assert np.allclose(cmap_r._lut[:-3], cmap._lut[:-3][::-1])
+
+
+def test_make_mapping_array_gamma():
+    """Tests the per-segment gamma scaling of the lookup table."""
+    N = 101
+    data = [[0, 0, 0], [0.5, 1, 1], [1, 0, 0]]  # increasing then decreasing
+    x = np.linspace(0, 1, N)
+    linear = np.interp(x, [0, 0.5, 1], [0, 1, 0])
+    assert np.allclose(plot.make_mapping_array(N, data, gamma=1), linear)
+    lut = plot.make_mapping_array(N, data, gamma=2)
+    assert np.all(lut <= linear + 1e-10)  # weighted toward lower values
+    assert np.any(lut < linear - 1e-3)
+    lut = plot.make_mapping_array(N, data, gamma=2, inverse=True)
+    assert np.all(lut >= linear - 1e-10)
+    lut = plot.make_mapping_array(N, data, gamma=[1, 2])  # per segment
+    assert np.allclose(lut[:N // 2 + 1], linear[:N // 2 + 1])
+    assert np.all(lut[N // 2:] <= linear[N // 2:] + 1e-10)
+
+
+def test_cmap_file_roundtrip(tmp_path):
+    """Tests that binary colormap files reproduce the saved colormaps."""
+    cmap = plot.LinearSegmentedColormap.from_list(
+        'test', ['red', 'blue', 'green'], gamma=1.5, cyclic=True,
+    )
+    filename = str(tmp_path / 'test.cmap')
+    cmap.save(filename)
+    cmap2 = plot.Colormap(filename)
+    assert isinstance(cmap2, plot.LinearSegmentedColormap)
+    assert cmap2._cyclic and cmap2._gamma == 1.5
+    cmap._init()
+    cmap2._init()
+    assert np.allclose(cmap._lut, cmap2._lut)
+    cmap = plot.Colormap('Set2')
+    filename = str(tmp_path / 'test.cmap')
+    cmap.save(filename)
+    cmap2 = styletools._from_file(filename, listed=True)
+    assert isinstance(cmap2, plot.ListedColormap)
+    assert np.allclose(mcolors.to_rgba_array(cmap.colors), cmap2.colors)
+
+
+def test_cmap_text_files(tmp_path):
+    """Tests the colors written to text colormap files."""
+    cmap = plot.Colormap('Set2')
+    colors = mcolors.to_rgba_array(cmap.colors)
+    filename = tmp_path / 'test.hex'
+    cmap.save(str(filename))
+    assert filename.read_text().split(', ') == [
+        mcolors.to_hex(color) for color in colors
+    ]
+    filename = tmp_path / 'test.rgb'
+    cmap.save(str(filename))
+    data = np.loadtxt(str(filename), delimiter=',')
+    assert np.allclose(data, colors[:, :3])
+
+
+def test_register_concurrent():
+    """Tests that loading files concurrently gives the same colormaps."""
+    samples = np.linspace(0, 1, 5)
+    results = []
+    for max_workers in (None, 4):
+        plot.register_cmaps(max_workers=max_workers)
+        plot.register_cycles(max_workers=max_workers)
+        names = (*plot.cmaps, *plot.cycles)
+        results.append({name: mcm.cmap_d[name](samples) for name in names})
+    assert results[0].keys() == results[1].keys()
+    for name, colors in results[0].items():
+        assert np.allclose(colors, results[1][name])
+
+
+@pytest.mark.parametrize('space', ['rgb', 'hsv', 'hsl', 'hpl', 'hcl'])
+def test_color_arrays(space):
+    """Tests that the array conversions match the scalar conversions."""
+    colors = ['red', '#1f77b4', (0.2, 0.4, 0.6), (0.1, 0.2, 0.3, 0.5), 'C1']
+    rgb = plot.to_rgb_array(colors, alpha=True)
+    assert rgb.shape == (5, 4)
+    assert np.allclose(rgb, [plot.to_rgb(c, alpha=True) for c in colors])
+    xyz = plot.to_xyz_array(colors, space=space)
+    assert np.allclose(xyz, [plot.to_xyz(c, space=space) for c in colors])
+    rgb = plot.to_rgb_array(xyz, space=space)
+    assert np.allclose(rgb, [plot.to_rgb(c, space=space) for c in xyz])
@@ -0,0 +1,277 @@
+import io
+import os
+
+import pytest
+import matplotlib.cm as mcm
+import matplotlib.legend as mlegend
+import matplotlib.pyplot as plt
+
+import proplot as plot
+
+
+def _make_figure(item):
+    """Return a figure for `render_batch`. Must be at the top level."""
+    fig, ax = plot.subplots()
+    ax.plot([0, item])
+    ax.format(title=f'item {item}')
+    return fig
+
+
+def _check_cmaps(item):
+    """Check the colormaps registered by `test_render_batch_cmaps`."""
+    assert plot.cmaps.count('batch_blues') == 1
+    assert mcm.cmap_d['batch_blues_r'].name == 'batch_blues_r'
+    fig, ax = plot.subplots()
+    ax.plot([0, item])
+    return fig
+
+
+def test_save_many(tmp_path):
+    """Tests that every requested file is written."""
+    fig, axs = plot.subplots(ncols=2)
+    axs.plot([0, 1])
+    buffer = io.BytesIO()
+    fig.save_many([
+        str(tmp_path / 'fig.pdf'),
+        tmp_path / 'fig.svg',
+        (str(tmp_path / 'fig.eps'), {'dpi': 100}),
+        (buffer, {'format': 'svg'}),
+    ])
+    for ext in ('pdf', 'svg', 'eps'):
+        assert (tmp_path / f'fig.{ext}').stat().st_size > 0
+    assert buffer.getvalue().startswith(b'<?xml')
+    plot.close(fig)
+
+
+def test_maxfigs(tmp_path):
+    """Tests that the least recently used figures are closed."""
+    plot.close('all')
+    plot.rc['subplots.maxfigs'] = 2
+    try:
+        figs = [plot.subplots()[0] for _ in range(3)]
+        assert not plt.fignum_exists(figs[0].number)
+        assert all(plt.fignum_exists(fig.number) for fig in figs[1:])
+        figs[1].save_many([str(tmp_path / 'fig.pdf')])  # most recently used
+        figs.append(plot.subplots()[0])
+    finally:
+        plot.rc['subplots.maxfigs'] = 0
+    assert plt.fignum_exists(figs[1].number)
+    assert not plt.fignum_exists(figs[2].number)
+    plot.close('all')
+
+
+def test_figure_context(tmp_path):
+    """Tests that figures used as context managers are closed on exit."""
+    with plot.subplots()[0] as fig:
+        fig.axes[0].plot([0, 1])
+        fig.savefig(str(tmp_path / 'fig.pdf'))
+        number = fig.number
+        assert plt.fignum_exists(number)
+    assert not plt.fignum_exists(number)
+    assert not fig.axes and not fig._axes_main
+    assert fig._layout_fingerprint is None
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_render_batch(tmp_path, max_workers):
+    """Tests that every requested file is written for every item."""
+    items = [1, 2]
+    filenames = [
+        [str(tmp_path / f'fig{item}.pdf'), str(tmp_path / f'fig{item}.svg')]
+        for item in items
+    ]
+    plot.render_batch(
+        _make_figure, items, filenames, max_workers=max_workers,
+    )
+    for names in filenames:
+        for name in names:
+            assert os.path.getsize(name) > 0
+
+
+def test_render_batch_cmaps(tmp_path):
+    """Tests that worker processes register the parent colormaps."""
+    cmap = plot.LinearSegmentedColormap.from_list(
+        'batch_blues', ['white', 'blue'],
+    )
+    mcm.cmap_d['batch_blues'] = cmap
+    try:
+        plot.render_batch(_check_cmaps, [1, 2], max_workers=2)
+    finally:
+        del mcm.cmap_d['batch_blues']
+    assert 'batch_blues' not in plot.cmaps
+    assert 'batch_blues_r' not in mcm.cmap_d
+
+
+def test_render_batch_kwargs():
+    """Tests that save keyword arguments require filenames."""
+    with pytest.raises(ValueError):
+        plot.render_batch(_make_figure, [1], dpi=100)
+
+
+@pytest.mark.parametrize('side', ['right', 'left', 'bottom', 'top'])
+def test_panel_share_limits(tmp_path, side):
+    """Tests that limits set before drawing are shared with panels."""
+    fig, ax = plot.subplots()
+    pax = ax.panel(side, share=True)
+    x = 'y' if side in ('left', 'right') else 'x'
+    getattr(ax, f'set_{x}lim')(0, 10)
+    fig.savefig(str(tmp_path / 'fig.pdf'))
+    assert getattr(pax, f'get_{x}lim')() == (0, 10)
+    getattr(pax, f'set_{x}lim')(0, 5)
+    assert getattr(ax, f'get_{x}lim')() == (0, 5)
+    plot.close(fig)
+
+
+def test_layout_fingerprint(tmp_path, monkeypatch):
+    """Tests that the layout is only recomputed after changes."""
+    count = []
+    adjust = plot.Figure._adjust_tight_layout
+
+    def _adjust_tight_layout(self, *args, **kwargs):
+        count.append(1)
+        return adjust(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        plot.Figure, '_adjust_tight_layout', _adjust_tight_layout
+    )
+    fig, axs = plot.subplots()
+    ax = axs[0]
+    lines = ax.plot([0, 1e5])
+    legend = mlegend.Legend(ax, lines, ['line'])
+    ax.add_artist(legend)
+    filename = str(tmp_path / 'fig.pdf')
+    fig.savefig(filename)
+    fig.savefig(filename)
+    assert len(count) == 1
+    ax.yaxis.get_major_formatter().set_powerlimits((-2, 2))
+    fig.savefig(filename)
+    assert len(count) == 2
+    legend.set_bbox_to_anchor((1, 1), transform=ax.transAxes)
+    fig.savefig(filename)
+    assert len(count) == 3
+    plot.close(fig)
+
+
+def test_subplot_grid_dispatch():
+    """Tests that cached dispatchers call the current axes in the grid."""
+    fig, axs = plot.subplots(ncols=3)
+    grid = axs[:2]
+    grid.set_title('first')
+    grid.append(axs[2])
+    grid.set_title('second')
+    assert [ax.get_title() for ax in axs] == ['second'] * 3
+    grid.pop(0)
+    grid.set_title('third')
+    assert [ax.get_title() for ax in axs] == ['second', 'third', 'third']
+    plot.close(fig)
+
+
+def test_subplots_sharing(tmp_path):
+    """Tests the axis sharing configured for the main subplots."""
+    fig, axs = plot.subplots(nrows=3, ncols=3, share=3)
+    for i, ax in enumerate(axs):
+        row, col = divmod(i, 3)
+        assert ax._sharex is (None if row == 2 else axs[6 + col])
+        assert ax._sharey is (None if col == 0 else axs[3 * row])
+    axs.format(ticklabelsize=13)
+    fig.savefig(str(tmp_path / 'fig.pdf'))  # creates more ticks
+    for ax in axs:
+        for tick in (*ax.xaxis.majorTicks, *ax.yaxis.majorTicks):
+            assert tick.label1.get_fontsize() == 13
+    plot.close(fig)
+
+
+def test_row_column_labels(tmp_path):
+    """Tests that row and column labels are created when assigned."""
+    fig, axs = plot.subplots(nrows=2, ncols=2)
+    assert all(ax._tlabel is None and ax._llabel is None for ax in axs)
+    axs.format(rc_kw={'toplabel.color': 'red'})  # applied on creation
+    axs.format(
+        collabels=['a', 'b'], rowlabels=['c', 'd'],
+        rc_kw={'leftlabel.size': 15},
+    )
+    assert [axs[0]._tlabel.get_text(), axs[1]._tlabel.get_text()] == [
+        'a', 'b'
+    ]
+    assert [axs[0]._llabel.get_text(), axs[2]._llabel.get_text()] == [
+        'c', 'd'
+    ]
+    assert axs[0]._llabel.get_fontsize() == 15
+    assert axs[0]._tlabel.get_color() == 'red'
+    assert axs[3]._tlabel is None and axs[3]._llabel is None
+    fig.savefig(str(tmp_path / 'fig.pdf'))
+    plot.close(fig)
+
+
+@pytest.mark.parametrize('panels', [
+    ['', '', ''], ['l', '', 'r', 'l', '', 'r'], ['', 'r', 'r', '', 'f'],
+    ['f', 'l', '', 'l', '', 'r'],
+])
+def test_geometry_indices(panels):
+    """Tests the main slot and space indices of the geometry solver."""
+    from proplot.subplots import _SubplotsGeometry
+    geometry = _SubplotsGeometry(wpanels=panels)
+    idxs_ratio, idxs_panel, idxs_space = geometry._idxs['w']
+    ratios = [idx for idx, panel in enumerate(panels) if not panel]
+    spaces = []
+    for idx in ratios[:-1]:
+        offset = 1
+        while panels[idx + offset] not in 'rbf':
+            offset += 1
+        spaces.append(idx + offset - 1)
+    assert idxs_ratio.tolist() == ratios
+    assert idxs_panel.tolist() == [
+        idx for idx, panel in enumerate(panels) if panel
+    ]
+    assert idxs_space.tolist() == spaces
+
+
+def test_geometry_solve():
+    """Tests the figure size and panel insertion of the geometry solver."""
+    fig, axs = plot.subplots(ncols=2, axwidth=2, aspect=2, tight=False)
+    width, height = fig.get_size_inches()
+    for ax in axs:
+        bbox = ax.get_position()
+        assert bbox.width * width == pytest.approx(2)
+        assert bbox.height * height == pytest.approx(1)
+    axs[0].panel('r', width=0.5, space=0.1)
+    geometry = fig._subplots_kw
+    assert geometry['ncols'] == 3
+    assert geometry['wpanels'].tolist() == ['', 'r', '']
+    assert geometry._idxs['w'][0].tolist() == [0, 2]
+    assert geometry['wratios'][1] == pytest.approx(0.5)
+    assert geometry['wspace'][0] == pytest.approx(0.1)
+    assert fig.get_size_inches()[0] == pytest.approx(width + 0.6)
+    plot.close(fig)
+
+
+def test_tight_layout_spacing(tmp_path):
+    """Tests that tight layout separates abutting axes and caches groups."""
+    fig, axs = plot.subplots(nrows=2, ncols=2, share=0)
+    axs.format(ylabel='ylabel', xlabel='xlabel', title='title')
+    axs[1].plot([0, 1e6])
+    filename = str(tmp_path / 'fig.pdf')
+    fig.savefig(filename)
+    _, index = fig._adjacency_index
+    fig.savefig(filename)
+    assert fig._adjacency_index[1] is index
+    renderer = fig.canvas.get_renderer()
+    bboxes = [ax.get_tightbbox(renderer) for ax in axs]
+    assert bboxes[0].x1 <= bboxes[1].x0 and bboxes[2].x1 <= bboxes[3].x0
+    assert bboxes[2].y1 <= bboxes[0].y0 and bboxes[3].y1 <= bboxes[1].y0
+    axs[0].panel('r')
+    fig.savefig(filename)
+    assert fig._adjacency_index[1] is not index
+    plot.close(fig)
+
+
+def test_subplot_grid_format():
+    """Tests that grid format settings are applied to every axes."""
+    fig, axs = plot.subplots(ncols=3)
+    color = plot.rc['title.color']
+    axs[1:].format(title='title', xlim=(0, 5), rc_kw={'title.color': 'red'})
+    assert [ax.title.get_text() for ax in axs] == ['', 'title', 'title']
+    assert [ax.title.get_color() for ax in axs[1:]] == ['red', 'red']
+    assert all(ax.get_xlim() == (0, 5) for ax in axs[1:])
+    assert plot.rc['title.color'] == color
+    plot.close(fig)
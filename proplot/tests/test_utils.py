@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+import proplot as plot
+
+
+def test_units():
+    """Tests unit conversions and the cached conversion table."""
+    assert plot.units('72pt') == pytest.approx(1)
+    assert plot.units('2.54cm', 'mm') == pytest.approx(25.4)
+    assert plot.units(['1in', 2, '36pt'], 'pt') == pytest.approx([72, 2, 36])
+    assert plot.units(np.array([1, 2])) == [1, 2]
+    assert plot.units(np.array(['1in', '36pt']), 'pt') == pytest.approx(
+        [72, 36]
+    )
+    assert plot.units(None) is None
+    with plot.rc.context({'font.size': 10}):
+        assert plot.units('1em', 'pt') == pytest.approx(10)
+        plot.rc['font.size'] = 20
+        assert plot.units('1em', 'pt') == pytest.approx(20)
+    with plot.rc.context({'figure.dpi': 100}):
+        assert plot.units('100px') == pytest.approx(1)
+    with pytest.raises(ValueError):
+        plot.units('1furlong')
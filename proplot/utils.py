@@ -239,6 +239,57 @@ def edges2d(Z):
     return Zb
 
 
+@functools.lru_cache(maxsize=8)
+def _get_unit_dict(small, large, dpi, savedpi):
+    """Return a dictionary of scales for converting physical and display units
+    to inches, given the :rcraw:`font.size`, :rcraw:`axes.titlesize`,
+    :rcraw:`figure.dpi`, and :rcraw:`savefig.dpi` settings."""
+    # Font unit scales
+    # NOTE: Delay font_manager import, because want to avoid rebuilding font
+    # cache, which means import must come after TTFPATH added to environ
+    # by styletools.register_fonts()!
+    if isinstance(large, str):
+        import matplotlib.font_manager as mfonts
+        # error will be raised somewhere else if string name is invalid!
+        scale = mfonts.font_scalings.get(large, 1)
+        large = small * scale
+
+    # Scales for converting physical units to inches
+    unit_dict = {
+        'in': 1.0,
+        'm': 39.37,
+        'ft': 12.0,
+        'cm': 0.3937,
+        'mm': 0.03937,
+        'pt': 1 / 72.0,
+        'pc': 1 / 6.0,
+        'em': small / 72.0,
+        'en': 0.5 * small / 72.0,
+        'Em': large / 72.0,
+        'En': 0.5 * large / 72.0,
+        'ly': 3.725e+17,
+    }
+    # Scales for converting display units to inches
+    # WARNING: In ipython shell these take the value 'figure'
+    if not isinstance(dpi, str):
+        # once generated by backend
+        unit_dict['px'] = 1 / dpi
+    if not isinstance(savedpi, str):
+        # once 'printed' i.e. saved
+        unit_dict['pp'] = 1 / savedpi
+    return unit_dict
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_units(string):
+    """Return the number and units for a size spec like ``'12pt'``."""
+    regex = NUMBER.match(string)
+    if not regex:
+        raise ValueError(f'Invalid size spec {string!r}.')
+    number, _, units = regex.groups()  # second group is exponential
+    return float(number), units
+
+
 def units(value, units='in', axes=None, figure=None, width=True):
     """
     Convert values and lists of values between arbitrary physical units. This
@@ -285,48 +336,21 @@ def units(value, units='in', axes=None, figure=None, width=True):
         Whether to use the width or height for the axes and figure relative
         coordinates.
     """  # noqa
-    # Font unit scales
-    # NOTE: Delay font_manager import, because want to avoid rebuilding font
-    # cache, which means import must come after TTFPATH added to environ
-    # by styletools.register_fonts()!
-    small = rcParams['font.size']  # must be absolute
-    large = rcParams['axes.titlesize']
-    if isinstance(large, str):
-        import matplotlib.font_manager as mfonts
-        # error will be raised somewhere else if string name is invalid!
-        scale = mfonts.font_scalings.get(large, 1)
-        large = small * scale
-
     # Scales for converting physical units to inches
-    unit_dict = {
-        'in': 1.0,
-        'm': 39.37,
-        'ft': 12.0,
-        'cm': 0.3937,
-        'mm': 0.03937,
-        'pt': 1 / 72.0,
-        'pc': 1 / 6.0,
-        'em': small / 72.0,
-        'en': 0.5 * small / 72.0,
-        'Em': large / 72.0,
-        'En': 0.5 * large / 72.0,
-        'ly': 3.725e+17,
-    }
-    # Scales for converting display units to inches
-    # WARNING: In ipython shell these take the value 'figure'
-    if not isinstance(rcParams['figure.dpi'], str):
-        # once generated by backend
-        unit_dict['px'] = 1 / rcParams['figure.dpi']
-    if not isinstance(rcParams['savefig.dpi'], str):
-        # once 'printed' i.e. saved
-        unit_dict['pp'] = 1 / rcParams['savefig.dpi']
+    # NOTE: Table is cached and only rebuilt when the font sizes or dpi change
+    unit_dict = _get_unit_dict(
+        rcParams['font.size'], rcParams['axes.titlesize'],
+        rcParams['figure.dpi'], rcParams['savefig.dpi'],
+    )
     # Scales relative to axes and figure objects
-    if axes is not None and hasattr(axes, 'get_size_inches'):  # proplot axes
-        unit_dict['ax'] = axes.get_size_inches()[1 - int(width)]
     if figure is None:
         figure = getattr(axes, 'figure', None)
+    if axes is not None and hasattr(axes, 'get_size_inches'):  # proplot axes
+        unit_dict = unit_dict.copy()
+        unit_dict['ax'] = axes.get_size_inches()[1 - int(width)]
     if figure is not None and hasattr(
             figure, 'get_size_inches'):  # proplot axes
+        unit_dict = unit_dict.copy()
         unit_dict['fig'] = figure.get_size_inches()[1 - int(width)]
     # Scale for converting inches to arbitrary other unit
     try:
@@ -338,8 +362,14 @@ def units(value, units='in', axes=None, figure=None, width=True):
         )
 
     # Convert units for each value in list
+    # NOTE: Numeric arrays are passed through without looping. Strings are
+    # looped over because the cached _parse_units lookups are faster than
+    # parsing and scaling them as arrays, even for thousands of values.
     result = []
     singleton = (not np.iterable(value) or isinstance(value, str))
+    if not singleton and isinstance(value, np.ndarray) and (
+            value.dtype.kind in 'iuf'):
+        return value.tolist()
     for val in ((value,) if singleton else value):
         if val is None or isinstance(val, Number):
             result.append(val)
@@ -349,16 +379,9 @@ def units(value, units='in', axes=None, figure=None, width=True):
                 f'Size spec must be string or number or list thereof. '
                 f'Got {value!r}.'
             )
-        regex = NUMBER.match(val)
-        if not regex:
-            raise ValueError(
-                f'Invalid size spec {val!r}. Valid units are '
-                + ', '.join(map(repr, unit_dict.keys())) + '.'
-            )
-        number, _, units = regex.groups()  # second group is exponential
         try:
-            result.append(
-                float(number) * (unit_dict[units] / scale if units else 1))
+            number, units = _parse_units(val)
+            result.append(number * (unit_dict[units] / scale if units else 1))
         except (KeyError, ValueError):
             raise ValueError(
                 f'Invalid size spec {val!r}. Valid units are '